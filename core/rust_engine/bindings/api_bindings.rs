@@ -1,24 +1,41 @@
 use pyo3::prelude::*;
 
-use crate::bindings::{error_handlers::map_error, type_converters::py_list_to_vec_i64};
-use crate::error::{ForziumError, catch_unwind_py};
+use crate::bindings::error_handlers::map_error;
+use crate::bindings::type_converters::{py_buffer_to_vec_i64, py_list_to_vec_i64};
+use crate::error::ForziumError;
 
 /// Sum a list of integers passed from Python.
+///
+/// Elements are folded as they are extracted, without collecting them into an
+/// intermediate vector; a sum that does not fit in `i64` raises `ValueError`.
+/// Objects exporting an int64 buffer, such as `array.array("q")`, are copied
+/// in one block instead of being converted element by element.
 #[pyfunction]
 pub fn sum_list(values: &Bound<PyAny>) -> PyResult<i64> {
-    catch_unwind_py(|| {
-        let vec = py_list_to_vec_i64(values)?;
-        if vec.is_empty() {
-            return Err(map_error(ForziumError::Validation("empty list".into())));
-        }
-        Ok(vec.iter().sum())
-    })
+    // Extraction errors and overflow come back as `Err`, so there is no panic
+    // to catch; PyO3's own trampoline still turns any stray panic into
+    // `PanicException`.
+    if let Some(buffer) = py_buffer_to_vec_i64(values)? {
+        return checked_sum(buffer.into_iter().map(Ok));
+    }
+    checked_sum(values.try_iter()?.map(|item| item?.extract::<i64>()))
+}
+
+fn checked_sum(values: impl Iterator<Item = PyResult<i64>>) -> PyResult<i64> {
+    let mut total: Option<i64> = None;
+    for value in values {
+        let sum = total.unwrap_or(0).checked_add(value?);
+        total = Some(
+            sum.ok_or_else(|| map_error(ForziumError::Validation("integer overflow".into())))?,
+        );
+    }
+    total.ok_or_else(|| map_error(ForziumError::Validation("empty list".into())))
 }
 
 /// Echo the provided sequence back to Python.
 #[pyfunction]
 pub fn echo_list(values: &Bound<PyAny>) -> PyResult<Vec<i64>> {
-    catch_unwind_py(|| py_list_to_vec_i64(values))
+    py_list_to_vec_i64(values)
 }
 
 /// Return the active span identifier from Python telemetry.
@@ -1,6 +1,127 @@
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyList, PyMemoryView};
+
+use crate::compute::tensor_ops::Matrix;
+use crate::error::ForziumError;
 
 /// Convert a Python sequence into a vector of integers.
 pub fn py_list_to_vec_i64(seq: &Bound<PyAny>) -> PyResult<Vec<i64>> {
     seq.extract::<Vec<i64>>()
 }
+
+/// Copy an integer buffer (e.g. `array.array("q")`) into a vector.
+///
+/// Returns `Ok(None)` when `obj` does not expose an int64 buffer so callers
+/// can fall back to sequence extraction.
+pub fn py_buffer_to_vec_i64(obj: &Bound<PyAny>) -> PyResult<Option<Vec<i64>>> {
+    if obj.is_instance_of::<PyList>() {
+        return Ok(None);
+    }
+    match PyBuffer::<i64>::get(obj) {
+        Ok(buf) => Ok(Some(buf.to_vec(obj.py())?)),
+        Err(_) => Ok(None),
+    }
+}
+
+/// Convert a 2-D matrix argument into nested rows.
+///
+/// Objects exporting a float64 or float32 buffer (NumPy arrays, memoryviews)
+/// are read with a single block copy; anything else goes through the regular
+/// element-by-element sequence extraction.
+pub fn py_matrix_to_rows(obj: &Bound<PyAny>) -> PyResult<Vec<Vec<f64>>> {
+    match py_buffer_to_flat(obj)? {
+        Some((data, _, cols)) if cols > 0 => {
+            Ok(data.chunks_exact(cols).map(<[f64]>::to_vec).collect())
+        }
+        Some((_, rows, _)) => Ok(vec![Vec::new(); rows]),
+        None => obj.extract::<Vec<Vec<f64>>>(),
+    }
+}
+
+/// Convert a 2-D matrix argument into a flat row-major [`Matrix`].
+///
+/// Buffers are copied in one block; nested sequences are flattened row by
+/// row and rejected if ragged.
+pub fn py_matrix_to_flat(obj: &Bound<PyAny>) -> PyResult<Matrix> {
+    if let Some((data, rows, cols)) = py_buffer_to_flat(obj)? {
+        return Ok(Matrix::from_flat(data, rows, cols)?);
+    }
+    let rows = obj.extract::<Vec<Vec<f64>>>()?;
+    let cols = rows.first().map_or(0, Vec::len);
+    if rows.iter().any(|row| row.len() != cols) {
+        return Err(ForziumError::Validation("ragged tensor".into()).into());
+    }
+    Ok(Matrix::from_rows(&rows))
+}
+
+/// Convert a 2-D matrix argument into flat row-major `f32` values.
+///
+/// float32 buffers are copied in one block; anything else is extracted as
+/// nested sequences, narrowed to `f32`, and rejected if ragged.
+pub fn py_matrix_to_flat_f32(obj: &Bound<PyAny>) -> PyResult<(Vec<f32>, usize, usize)> {
+    if !obj.is_instance_of::<PyList>() {
+        if let Ok(buf) = PyBuffer::<f32>::get(obj) {
+            let (rows, cols) = buffer_shape(buf.shape())?;
+            return Ok((buf.to_vec(obj.py())?, rows, cols));
+        }
+    }
+    let rows = obj.extract::<Vec<Vec<f32>>>()?;
+    let cols = rows.first().map_or(0, Vec::len);
+    if rows.iter().any(|row| row.len() != cols) {
+        return Err(ForziumError::Validation("ragged tensor".into()).into());
+    }
+    Ok((rows.concat(), rows.len(), cols))
+}
+
+/// Return row-major `data` to Python as a read-only 2-D float64 memoryview.
+///
+/// The values are written once into a `bytes` object; `numpy.asarray` wraps
+/// the view without copying and `tolist()` gives nested lists back.
+pub fn flat_to_py_buffer<'py>(
+    py: Python<'py>,
+    data: &[f64],
+    rows: usize,
+    cols: usize,
+) -> PyResult<Bound<'py, PyAny>> {
+    let bytes = PyBytes::new_with(py, std::mem::size_of_val(data), |buf| {
+        for (dst, value) in buf.chunks_exact_mut(8).zip(data) {
+            dst.copy_from_slice(&value.to_ne_bytes());
+        }
+        Ok(())
+    })?;
+    PyMemoryView::from(bytes.as_any())?.call_method1("cast", ("d", (rows, cols)))
+}
+
+/// Read a 2-D float buffer into a flat row-major vector.
+///
+/// Returns `Ok(None)` when `obj` does not expose a float64/float32 buffer so
+/// callers can fall back to sequence extraction.
+pub fn py_buffer_to_flat(obj: &Bound<PyAny>) -> PyResult<Option<(Vec<f64>, usize, usize)>> {
+    // Lists never export a buffer; skip the probe and its discarded error.
+    if obj.is_instance_of::<PyList>() {
+        return Ok(None);
+    }
+    let py = obj.py();
+    if let Ok(buf) = PyBuffer::<f64>::get(obj) {
+        let (rows, cols) = buffer_shape(buf.shape())?;
+        return Ok(Some((buf.to_vec(py)?, rows, cols)));
+    }
+    if let Ok(buf) = PyBuffer::<f32>::get(obj) {
+        let (rows, cols) = buffer_shape(buf.shape())?;
+        let data = buf.to_vec(py)?.into_iter().map(f64::from).collect();
+        return Ok(Some((data, rows, cols)));
+    }
+    Ok(None)
+}
+
+fn buffer_shape(shape: &[usize]) -> PyResult<(usize, usize)> {
+    match *shape {
+        [rows, cols] => Ok((rows, cols)),
+        _ => Err(ForziumError::Validation(format!(
+            "expected a 2-D buffer, got {} dimension(s)",
+            shape.len()
+        ))
+        .into()),
+    }
+}
@@ -1,6 +1,15 @@
 //! Data preprocessing and transformation routines.
 
 use crate::error::ForziumError;
+use smallvec::{smallvec, SmallVec};
+#[cfg(target_arch = "x86_64")]
+use std::arch::x86_64::*;
+
+/// Output of the element-wise vector transforms.
+///
+/// Vectors of up to 32 values, the common case for feature rows, stay on the
+/// stack; longer ones spill to the heap as a regular `Vec` would.
+pub type Values = SmallVec<[f64; 32]>;
 
 fn validate_vec(v: &[f64]) -> Result<(), ForziumError> {
     if v.is_empty() {
@@ -10,27 +19,123 @@ fn validate_vec(v: &[f64]) -> Result<(), ForziumError> {
 }
 
 /// Scale all elements of the vector by `factor`.
-pub fn scale(v: &[f64], factor: f64) -> Result<Vec<f64>, ForziumError> {
+pub fn scale(v: &[f64], factor: f64) -> Result<Values, ForziumError> {
     validate_vec(v)?;
-    Ok(v.iter().map(|x| x * factor).collect())
+    let mut out: Values = smallvec![0.0; v.len()];
+    #[cfg(target_arch = "x86_64")]
+    if is_x86_feature_detected!("avx2") {
+        // SAFETY: AVX2 support was checked at runtime; `out` matches `v`.
+        unsafe { scale_avx2(v, factor, &mut out) };
+        return Ok(out);
+    }
+    for (o, x) in out.iter_mut().zip(v) {
+        *o = x * factor;
+    }
+    Ok(out)
 }
 
 /// Normalize elements into the 0..1 range using min-max scaling.
-pub fn normalize(v: &[f64]) -> Result<Vec<f64>, ForziumError> {
+pub fn normalize(v: &[f64]) -> Result<Values, ForziumError> {
     validate_vec(v)?;
-    let (min, max) = v
-        .iter()
-        .fold((f64::INFINITY, f64::NEG_INFINITY), |(mn, mx), &x| {
-            (mn.min(x), mx.max(x))
-        });
+    let (min, max) = min_max(v);
     if min == max {
         return Err(ForziumError::Validation("constant vector".into()));
     }
-    Ok(v.iter().map(|x| (x - min) / (max - min)).collect())
+    let range = max - min;
+    let mut out: Values = smallvec![0.0; v.len()];
+    #[cfg(target_arch = "x86_64")]
+    if is_x86_feature_detected!("avx2") {
+        // SAFETY: AVX2 support was checked at runtime; `out` matches `v`.
+        unsafe { shift_divide_avx2(v, min, range, &mut out) };
+        return Ok(out);
+    }
+    for (o, x) in out.iter_mut().zip(v) {
+        *o = (x - min) / range;
+    }
+    Ok(out)
 }
 
-/// Reshape `v` into a matrix with `rows` × `cols` dimensions.
-pub fn reshape(v: &[f64], rows: usize, cols: usize) -> Result<Vec<Vec<f64>>, ForziumError> {
+/// Smallest and largest element, ignoring NaNs like `f64::min`/`f64::max`.
+fn min_max(v: &[f64]) -> (f64, f64) {
+    #[cfg(target_arch = "x86_64")]
+    if is_x86_feature_detected!("avx2") {
+        // SAFETY: AVX2 support was checked at runtime.
+        return unsafe { min_max_avx2(v) };
+    }
+    v.iter()
+        .fold((f64::INFINITY, f64::NEG_INFINITY), |(mn, mx), &x| {
+            (mn.min(x), mx.max(x))
+        })
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn scale_avx2(v: &[f64], factor: f64, out: &mut [f64]) {
+    unsafe {
+        let vf = _mm256_set1_pd(factor);
+        let mut i = 0;
+        while i + 4 <= v.len() {
+            let x = _mm256_loadu_pd(v.as_ptr().add(i));
+            _mm256_storeu_pd(out.as_mut_ptr().add(i), _mm256_mul_pd(x, vf));
+            i += 4;
+        }
+        for j in i..v.len() {
+            out[j] = v[j] * factor;
+        }
+    }
+}
+
+/// `out = (v - min) / range`; divides rather than multiplying by a
+/// reciprocal so results match the scalar path bit for bit.
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn shift_divide_avx2(v: &[f64], min: f64, range: f64, out: &mut [f64]) {
+    unsafe {
+        let vmin = _mm256_set1_pd(min);
+        let vrange = _mm256_set1_pd(range);
+        let mut i = 0;
+        while i + 4 <= v.len() {
+            let x = _mm256_loadu_pd(v.as_ptr().add(i));
+            let shifted = _mm256_sub_pd(x, vmin);
+            _mm256_storeu_pd(out.as_mut_ptr().add(i), _mm256_div_pd(shifted, vrange));
+            i += 4;
+        }
+        for j in i..v.len() {
+            out[j] = (v[j] - min) / range;
+        }
+    }
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn min_max_avx2(v: &[f64]) -> (f64, f64) {
+    unsafe {
+        // `_mm256_min_pd(x, acc)` returns `acc` when `x` is NaN, which keeps
+        // NaNs out of the running extremes.
+        let mut vmin = _mm256_set1_pd(f64::INFINITY);
+        let mut vmax = _mm256_set1_pd(f64::NEG_INFINITY);
+        let mut i = 0;
+        while i + 4 <= v.len() {
+            let x = _mm256_loadu_pd(v.as_ptr().add(i));
+            vmin = _mm256_min_pd(x, vmin);
+            vmax = _mm256_max_pd(x, vmax);
+            i += 4;
+        }
+        let (mut lo, mut hi) = ([0.0f64; 4], [0.0f64; 4]);
+        _mm256_storeu_pd(lo.as_mut_ptr(), vmin);
+        _mm256_storeu_pd(hi.as_mut_ptr(), vmax);
+        let init = (
+            lo.iter().copied().fold(f64::INFINITY, f64::min),
+            hi.iter().copied().fold(f64::NEG_INFINITY, f64::max),
+        );
+        v[i..]
+            .iter()
+            .fold(init, |(mn, mx), &x| (mn.min(x), mx.max(x)))
+    }
+}
+
+/// Check that `v` can be viewed as a `rows` × `cols` matrix.
+pub fn validate_reshape(v: &[f64], rows: usize, cols: usize) -> Result<(), ForziumError> {
     validate_vec(v)?;
     if rows == 0 || cols == 0 {
         return Err(ForziumError::Validation("zero dimension".into()));
@@ -38,6 +143,12 @@ pub fn reshape(v: &[f64], rows: usize, cols: usize) -> Result<Vec<Vec<f64>>, For
     if rows * cols != v.len() {
         return Err(ForziumError::Validation("shape mismatch".into()));
     }
+    Ok(())
+}
+
+/// Reshape `v` into a matrix with `rows` × `cols` dimensions.
+pub fn reshape(v: &[f64], rows: usize, cols: usize) -> Result<Vec<Vec<f64>>, ForziumError> {
+    validate_reshape(v, rows, cols)?;
     let mut out = vec![vec![0.0; cols]; rows];
     for i in 0..rows {
         for j in 0..cols {
@@ -54,13 +165,44 @@ mod tests {
     #[test]
     fn scale_valid() {
         let v = vec![1.0, 2.0];
-        assert_eq!(scale(&v, 2.0).unwrap(), vec![2.0, 4.0]);
+        assert_eq!(scale(&v, 2.0).unwrap().as_slice(), [2.0, 4.0]);
     }
 
     #[test]
     fn normalize_valid() {
         let v = vec![1.0, 3.0, 5.0];
-        assert_eq!(normalize(&v).unwrap(), vec![0.0, 0.5, 1.0]);
+        assert_eq!(normalize(&v).unwrap().as_slice(), [0.0, 0.5, 1.0]);
+    }
+
+    #[test]
+    fn simd_paths_match_scalar() {
+        let v: Vec<f64> = (0..11).map(|i| (i as f64 * 1.7).sin() * 10.0).collect();
+        let scaled: Vec<f64> = v.iter().map(|x| x * 0.3).collect();
+        assert_eq!(scale(&v, 0.3).unwrap().as_slice(), scaled);
+
+        let (mn, mx) = v
+            .iter()
+            .fold((f64::INFINITY, f64::NEG_INFINITY), |(a, b), &x| {
+                (a.min(x), b.max(x))
+            });
+        assert_eq!(min_max(&v), (mn, mx));
+        let normalized: Vec<f64> = v.iter().map(|x| (x - mn) / (mx - mn)).collect();
+        assert_eq!(normalize(&v).unwrap().as_slice(), normalized);
+    }
+
+    #[test]
+    fn long_vectors_spill_to_heap() {
+        let v: Vec<f64> = (0..40).map(f64::from).collect();
+        let out = scale(&v, 2.0).unwrap();
+        assert!(out.spilled());
+        assert_eq!(out[39], 78.0);
+        assert!(!scale(&v[..3], 2.0).unwrap().spilled());
+    }
+
+    #[test]
+    fn min_max_ignores_nan() {
+        let v = [f64::NAN, 2.0, -1.0, f64::NAN, 5.0, 0.0];
+        assert_eq!(min_max(&v), (-1.0, 5.0));
     }
 
     #[test]
@@ -1,8 +1,10 @@
 pub mod data_transform;
 pub mod engine;
+pub mod gemm;
 pub mod ml_inference;
 pub mod rayon_metrics;
 pub mod resource_limits;
+pub mod scratch;
 pub mod simd_ops;
 pub mod tensor_ops;
 pub mod thread_pool;
@@ -0,0 +1,95 @@
+//! Grow-only, per-thread scratch buffers for kernel temporaries.
+//!
+//! Packing panels, transposed copies and flattened operands are rebuilt on
+//! every call but never escape it, so each thread keeps its buffers between
+//! calls instead of going back to the allocator. A buffer is moved out of
+//! its slot while in use and moved back afterwards; a nested call on the
+//! same thread (e.g. a rayon worker stealing another kernel's job) simply
+//! starts from an empty buffer.
+
+use std::cell::Cell;
+use std::thread::LocalKey;
+
+thread_local! {
+    /// Packed `A` panels for the blocked GEMM.
+    pub static PACK_A: Cell<Vec<f64>> = const { Cell::new(Vec::new()) };
+    /// Packed `B` panels for the blocked GEMM.
+    pub static PACK_B: Cell<Vec<f64>> = const { Cell::new(Vec::new()) };
+    /// Transposed right-hand operand of the small-matrix product.
+    pub static TRANSPOSED: Cell<Vec<f64>> = const { Cell::new(Vec::new()) };
+    /// Flattened left-hand operand of an elementwise kernel.
+    pub static LHS: Cell<Vec<f64>> = const { Cell::new(Vec::new()) };
+    /// Flattened right-hand operand of an elementwise kernel.
+    pub static RHS: Cell<Vec<f64>> = const { Cell::new(Vec::new()) };
+}
+
+/// Run `f` with the calling thread's buffer for `slot`.
+///
+/// The buffer keeps whatever contents and capacity the previous user left;
+/// callers clear or overwrite it themselves.
+pub fn with_buffer<R>(
+    slot: &'static LocalKey<Cell<Vec<f64>>>,
+    f: impl FnOnce(&mut Vec<f64>) -> R,
+) -> R {
+    let mut buf = slot.with(Cell::take);
+    let result = f(&mut buf);
+    slot.with(|cell| {
+        // Keep the larger buffer if a nested call left one behind.
+        let nested = cell.replace(Vec::new());
+        cell.set(if nested.capacity() > buf.capacity() {
+            nested
+        } else {
+            buf
+        });
+    });
+    result
+}
+
+/// Drop the calling thread's scratch buffers and return the bytes released.
+///
+/// The next kernel on this thread starts again from empty buffers.
+pub fn release() -> usize {
+    [&PACK_A, &PACK_B, &TRANSPOSED, &LHS, &RHS]
+        .into_iter()
+        .map(|slot| slot.with(Cell::take).capacity() * std::mem::size_of::<f64>())
+        .sum()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn buffer_capacity_is_reused() {
+        with_buffer(&PACK_A, |buf| {
+            buf.clear();
+            buf.resize(1024, 1.0);
+        });
+        let capacity = with_buffer(&PACK_A, |buf| buf.capacity());
+        assert!(capacity >= 1024);
+    }
+
+    #[test]
+    fn release_returns_freed_capacity() {
+        with_buffer(&LHS, |buf| {
+            buf.clear();
+            buf.reserve_exact(256);
+        });
+        assert!(release() >= 256 * std::mem::size_of::<f64>());
+        assert_eq!(release(), 0);
+        assert_eq!(with_buffer(&LHS, |buf| buf.capacity()), 0);
+    }
+
+    #[test]
+    fn nested_use_gets_separate_buffer() {
+        with_buffer(&PACK_B, |outer| {
+            outer.clear();
+            outer.push(1.0);
+            with_buffer(&PACK_B, |inner| {
+                assert!(inner.is_empty());
+                inner.push(2.0);
+            });
+            assert_eq!(outer.as_slice(), &[1.0]);
+        });
+    }
+}
@@ -1,9 +1,75 @@
+use crate::compute::gemm;
 use crate::compute::rayon_metrics;
 use crate::compute::resource_limits::{check_tensor_size, OpGuard, RESOURCE_LIMITS};
+use crate::compute::scratch;
 use crate::error::ForziumError;
 use rayon::prelude::*;
 #[cfg(target_arch = "x86_64")]
 use std::arch::x86_64::*;
+use std::sync::OnceLock;
+
+/// Dense row-major matrix backed by a single contiguous buffer.
+///
+/// Kernels that walk whole rows (matmul, simd_matmul) flatten their
+/// `Vec<Vec<f64>>` inputs into this form once so the inner loops stream
+/// sequential memory instead of hopping between per-row allocations.
+#[derive(Debug, Clone, PartialEq)]
+pub struct Matrix {
+    pub data: Vec<f64>,
+    pub rows: usize,
+    pub cols: usize,
+}
+
+impl Matrix {
+    /// Wrap an existing row-major buffer of `rows * cols` values.
+    pub fn from_flat(data: Vec<f64>, rows: usize, cols: usize) -> Result<Self, ForziumError> {
+        if data.len() != rows * cols {
+            return Err(ForziumError::Validation("shape mismatch".into()));
+        }
+        Ok(Self { data, rows, cols })
+    }
+
+    /// Copy rectangular rows into one contiguous buffer.
+    ///
+    /// Callers are expected to have validated that `m` is not ragged.
+    pub fn from_rows(m: &[Vec<f64>]) -> Self {
+        let rows = m.len();
+        let cols = m.first().map_or(0, Vec::len);
+        let mut data = Vec::with_capacity(rows * cols);
+        for row in m {
+            data.extend_from_slice(row);
+        }
+        Self { data, rows, cols }
+    }
+
+    /// Borrow row `r` as a slice.
+    #[inline]
+    pub fn row(&self, r: usize) -> &[f64] {
+        &self.data[r * self.cols..(r + 1) * self.cols]
+    }
+
+    /// Return the transposed matrix.
+    pub fn transposed(&self) -> Self {
+        let mut data = vec![0.0; self.data.len()];
+        transpose_into(&self.data, self.rows, self.cols, &mut data);
+        Self {
+            data,
+            rows: self.cols,
+            cols: self.rows,
+        }
+    }
+
+    /// Split back into one `Vec` per row for the list-based API.
+    pub fn into_rows(self) -> Vec<Vec<f64>> {
+        if self.cols == 0 {
+            return vec![Vec::new(); self.rows];
+        }
+        self.data
+            .chunks_exact(self.cols)
+            .map(<[f64]>::to_vec)
+            .collect()
+    }
+}
 
 fn validate_matrix(m: &[Vec<f64>], operation: &str) -> Result<(usize, usize), ForziumError> {
     if m.is_empty() || m[0].is_empty() {
@@ -35,7 +101,102 @@ fn validate_same_shape(
     Ok((rows_a, cols_a))
 }
 
+/// Work (multiply-adds or element ops) below which matmul and elementwise
+/// kernels stay on the calling thread.
+const PARALLEL_MIN_WORK: usize = 32_768;
+
+/// Lower cut-off for `simd_elementwise_add`, whose per-element work is a
+/// single vector add.
+const SIMD_ADD_PARALLEL_MIN_WORK: usize = 4_096;
+
+/// Run `kernel(first_row, rows)` over `out`, split into blocks of whole rows.
+///
+/// `out` holds rows of `row_len` items each, and every row costs `row_work`.
+/// Blocks are bisected with `rayon::join` until they hold at most `min_work`,
+/// so small inputs run inline as one tracked task without touching the pool.
+fn for_row_blocks<T, F>(
+    out: &mut [T],
+    row_len: usize,
+    first_row: usize,
+    row_work: usize,
+    min_work: usize,
+    kernel: &F,
+) where
+    T: Send,
+    F: Fn(usize, &mut [T]) + Sync,
+{
+    let rows = out.len() / row_len.max(1);
+    if rows <= 1 || rows * row_work <= min_work {
+        let _guard = rayon_metrics::track_task();
+        kernel(first_row, out);
+        return;
+    }
+    let mid = rows / 2;
+    let (upper, lower) = out.split_at_mut(mid * row_len);
+    rayon::join(
+        || for_row_blocks(upper, row_len, first_row, row_work, min_work, kernel),
+        || for_row_blocks(lower, row_len, first_row + mid, row_work, min_work, kernel),
+    );
+}
+
+/// Apply `op(a, b, out)` to two same-shape matrices as one flat stream.
+///
+/// Both operands are copied into the calling thread's scratch buffers so the
+/// kernel sees whole blocks of rows as a single slice instead of one short
+/// row at a time; the result is split back into rows at the end.
+fn zip_flat<F>(
+    a: &[Vec<f64>],
+    b: &[Vec<f64>],
+    rows: usize,
+    cols: usize,
+    min_work: usize,
+    op: F,
+) -> Vec<Vec<f64>>
+where
+    F: Fn(&[f64], &[f64], &mut [f64]) + Sync,
+{
+    scratch::with_buffer(&scratch::LHS, |lhs| {
+        scratch::with_buffer(&scratch::RHS, |rhs| {
+            flatten_into(a, lhs);
+            flatten_into(b, rhs);
+            let (lhs, rhs) = (&*lhs, &*rhs);
+            let mut out = vec![0.0; rows * cols];
+            let kernel = |first: usize, block: &mut [f64]| {
+                let span = first * cols..first * cols + block.len();
+                op(&lhs[span.clone()], &rhs[span], block);
+            };
+            for_row_blocks(&mut out, cols, 0, cols, min_work, &kernel);
+            Matrix {
+                data: out,
+                rows,
+                cols,
+            }
+            .into_rows()
+        })
+    })
+}
+
+/// Overwrite `dst` with the rows of `m`, back to back.
+fn flatten_into(m: &[Vec<f64>], dst: &mut Vec<f64>) {
+    dst.clear();
+    for row in m {
+        dst.extend_from_slice(row);
+    }
+}
+
+/// Scale a single value; the scalar counterpart of [`multiply`].
+#[inline]
+pub fn multiply_scalar(value: f64, factor: f64) -> f64 {
+    value * factor
+}
+
 pub fn multiply(m: &[Vec<f64>], factor: f64) -> Result<Vec<Vec<f64>>, ForziumError> {
+    // 1x1 inputs skip the guard bookkeeping and parallel row setup entirely
+    if let [row] = m {
+        if let [value] = row.as_slice() {
+            return Ok(vec![vec![multiply_scalar(*value, factor)]]);
+        }
+    }
     validate_matrix(m, "multiply")?;
 
     // Try to acquire operation guard
@@ -78,7 +239,7 @@ pub fn add(m: &[Vec<f64>], addend: f64) -> Result<Vec<Vec<f64>>, ForziumError> {
 }
 
 pub fn transpose(m: &[Vec<f64>]) -> Result<Vec<Vec<f64>>, ForziumError> {
-    let (rows, cols) = validate_matrix(m, "transpose")?;
+    validate_matrix(m, "transpose")?;
 
     // Try to acquire operation guard
     let _op_guard = OpGuard::try_new().ok_or_else(|| {
@@ -90,18 +251,163 @@ pub fn transpose(m: &[Vec<f64>]) -> Result<Vec<Vec<f64>>, ForziumError> {
         ))
     })?;
 
-    let mut out = vec![vec![0.0; rows]; cols];
-    for (r, row) in m.iter().enumerate() {
-        for (c, val) in row.iter().enumerate() {
-            out[c][r] = *val;
+    Ok(Matrix::from_rows(m).transposed().into_rows())
+}
+
+/// Transpose a flat matrix, e.g. one read straight from a Python buffer.
+pub fn transpose_flat(m: &Matrix) -> Result<Matrix, ForziumError> {
+    if m.rows == 0 || m.cols == 0 {
+        return Err(ForziumError::Validation("empty tensor".into()));
+    }
+    check_tensor_size(m.rows, m.cols, "transpose").map_err(ForziumError::ResourceLimit)?;
+
+    // Try to acquire operation guard
+    let _op_guard = OpGuard::try_new().ok_or_else(|| {
+        ForziumError::ResourceLimit(format!(
+            "Maximum concurrent operations ({}) reached",
+            RESOURCE_LIMITS
+                .max_concurrent_ops
+                .load(std::sync::atomic::Ordering::SeqCst)
+        ))
+    })?;
+    Ok(m.transposed())
+}
+
+/// Blocks at or below this many elements are transposed directly; about
+/// 8 KiB of source plus destination, comfortably inside L1.
+const TRANSPOSE_BLOCK: usize = 1024;
+
+/// Write the transpose of the row-major `rows x cols` matrix `src` into `dst`.
+///
+/// Recursively halves the longer side until a block fits in L1, so both the
+/// reads and the strided writes stay cache-resident whatever the shape.
+fn transpose_into(src: &[f64], rows: usize, cols: usize, dst: &mut [f64]) {
+    let simd = simd_transpose_available();
+    transpose_block(src, dst, rows, cols, (0, rows), (0, cols), simd);
+}
+
+fn transpose_block(
+    src: &[f64],
+    dst: &mut [f64],
+    rows: usize,
+    cols: usize,
+    (r0, r1): (usize, usize),
+    (c0, c1): (usize, usize),
+    simd: bool,
+) {
+    let (height, width) = (r1 - r0, c1 - c0);
+    if height * width <= TRANSPOSE_BLOCK {
+        transpose_tile(src, dst, rows, cols, (r0, r1), (c0, c1), simd);
+    } else if height >= width {
+        let mid = r0 + height / 2;
+        transpose_block(src, dst, rows, cols, (r0, mid), (c0, c1), simd);
+        transpose_block(src, dst, rows, cols, (mid, r1), (c0, c1), simd);
+    } else {
+        let mid = c0 + width / 2;
+        transpose_block(src, dst, rows, cols, (r0, r1), (c0, mid), simd);
+        transpose_block(src, dst, rows, cols, (r0, r1), (mid, c1), simd);
+    }
+}
+
+/// Base case: 4x4 register transposes where available, scalar at the edges.
+fn transpose_tile(
+    src: &[f64],
+    dst: &mut [f64],
+    rows: usize,
+    cols: usize,
+    (r0, r1): (usize, usize),
+    (c0, c1): (usize, usize),
+    simd: bool,
+) {
+    let (r4, c4) = if simd {
+        transpose_tiles_simd(src, dst, rows, cols, (r0, r1), (c0, c1))
+    } else {
+        (r0, c0)
+    };
+    for r in r0..r1 {
+        // Rows above `r4` already had columns `c0..c4` written by the tiles.
+        let start = if r < r4 { c4 } else { c0 };
+        for c in start..c1 {
+            dst[c * rows + r] = src[r * cols + c];
+        }
+    }
+}
+
+/// Transpose the largest 4-aligned sub-block with AVX; returns the first row
+/// and column it did not cover.
+fn transpose_tiles_simd(
+    src: &[f64],
+    dst: &mut [f64],
+    rows: usize,
+    cols: usize,
+    (r0, r1): (usize, usize),
+    (c0, c1): (usize, usize),
+) -> (usize, usize) {
+    #[cfg(target_arch = "x86_64")]
+    {
+        let r4 = r0 + (r1 - r0) / 4 * 4;
+        let c4 = c0 + (c1 - c0) / 4 * 4;
+        for r in (r0..r4).step_by(4) {
+            for c in (c0..c4).step_by(4) {
+                // SAFETY: AVX support was checked by the caller and the
+                // 4x4 tile lies inside both matrices.
+                unsafe { transpose_4x4_avx(src, dst, rows, cols, r, c) };
+            }
+        }
+        (r4, c4)
+    }
+    #[cfg(not(target_arch = "x86_64"))]
+    {
+        let _ = (src, dst, rows, cols, r1, c1);
+        (r0, c0)
+    }
+}
+
+#[inline]
+fn simd_transpose_available() -> bool {
+    #[cfg(target_arch = "x86_64")]
+    {
+        is_x86_feature_detected!("avx")
+    }
+    #[cfg(not(target_arch = "x86_64"))]
+    {
+        false
+    }
+}
+
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx")]
+unsafe fn transpose_4x4_avx(
+    src: &[f64],
+    dst: &mut [f64],
+    rows: usize,
+    cols: usize,
+    r: usize,
+    c: usize,
+) {
+    unsafe {
+        let load = |i: usize| _mm256_loadu_pd(src.as_ptr().add((r + i) * cols + c));
+        let (a, b, e, f) = (load(0), load(1), load(2), load(3));
+        // [a0 b0 a2 b2], [a1 b1 a3 b3], [e0 f0 e2 f2], [e1 f1 e3 f3]
+        let ab_even = _mm256_unpacklo_pd(a, b);
+        let ab_odd = _mm256_unpackhi_pd(a, b);
+        let ef_even = _mm256_unpacklo_pd(e, f);
+        let ef_odd = _mm256_unpackhi_pd(e, f);
+        let out = [
+            _mm256_permute2f128_pd::<0x20>(ab_even, ef_even),
+            _mm256_permute2f128_pd::<0x20>(ab_odd, ef_odd),
+            _mm256_permute2f128_pd::<0x31>(ab_even, ef_even),
+            _mm256_permute2f128_pd::<0x31>(ab_odd, ef_odd),
+        ];
+        for (k, col) in out.into_iter().enumerate() {
+            _mm256_storeu_pd(dst.as_mut_ptr().add((c + k) * rows + r), col);
         }
     }
-    Ok(out)
 }
 
 pub fn matmul(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<Vec<Vec<f64>>, ForziumError> {
     let (_rows_a, cols_a) = validate_matrix(a, "matmul")?;
-    let (rows_b, cols_b) = validate_matrix(b, "matmul")?;
+    let (rows_b, _cols_b) = validate_matrix(b, "matmul")?;
     if cols_a != rows_b {
         return Err(ForziumError::Validation("shape mismatch".into()));
     }
@@ -115,26 +421,34 @@ pub fn matmul(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<Vec<Vec<f64>>, ForziumEr
                 .load(std::sync::atomic::Ordering::SeqCst)
         ))
     })?;
-    let out: Vec<Vec<f64>> = a
-        .par_iter()
-        .map(|row_a| {
-            let _guard = rayon_metrics::track_task();
-            let mut out_row = vec![0.0; cols_b];
-            for (k, val_a) in row_a.iter().enumerate() {
-                let row_b = &b[k];
-                for (j, val_b) in row_b.iter().enumerate() {
-                    out_row[j] += val_a * val_b;
+    Ok(matmul_flat(&Matrix::from_rows(a), &Matrix::from_rows(b)).into_rows())
+}
+
+/// i-k-j product over contiguous storage, split by rows above
+/// [`PARALLEL_MIN_WORK`].
+fn matmul_flat(a: &Matrix, b: &Matrix) -> Matrix {
+    let mut out = vec![0.0; a.rows * b.cols];
+    let row_work = a.cols * b.cols;
+    let kernel = |first: usize, block: &mut [f64]| {
+        for (i, out_row) in block.chunks_exact_mut(b.cols).enumerate() {
+            for (k, val_a) in a.row(first + i).iter().enumerate() {
+                for (out_val, val_b) in out_row.iter_mut().zip(b.row(k)) {
+                    *out_val += val_a * val_b;
                 }
             }
-            out_row
-        })
-        .collect();
-    Ok(out)
+        }
+    };
+    for_row_blocks(&mut out, b.cols, 0, row_work, PARALLEL_MIN_WORK, &kernel);
+    Matrix {
+        data: out,
+        rows: a.rows,
+        cols: b.cols,
+    }
 }
 
 pub fn simd_matmul(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<Vec<Vec<f64>>, ForziumError> {
     let (_rows_a, cols_a) = validate_matrix(a, "simd_matmul")?;
-    let (rows_b, cols_b) = validate_matrix(b, "simd_matmul")?;
+    let (rows_b, _cols_b) = validate_matrix(b, "simd_matmul")?;
     if cols_a != rows_b {
         return Err(ForziumError::Validation("shape mismatch".into()));
     }
@@ -148,52 +462,282 @@ pub fn simd_matmul(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<Vec<Vec<f64>>, Forz
                 .load(std::sync::atomic::Ordering::SeqCst)
         ))
     })?;
-    let bt = transpose(b)?;
-    let out: Vec<Vec<f64>> = a
-        .par_iter()
-        .map(|row_a| {
-            let _guard = rayon_metrics::track_task();
-            let mut out_row = vec![0.0; cols_b];
-            #[cfg(target_arch = "x86_64")]
-            unsafe {
-                for (bt_row, out_cell) in bt.iter().zip(out_row.iter_mut()) {
-                    let mut k = 0;
-                    let mut vsum = _mm_set1_pd(0.0);
-                    while k + 2 <= cols_a {
-                        let va = _mm_loadu_pd(row_a.as_ptr().add(k));
-                        let vb = _mm_loadu_pd(bt_row.as_ptr().add(k));
-                        let prod = _mm_mul_pd(va, vb);
-                        vsum = _mm_add_pd(vsum, prod);
-                        k += 2;
-                    }
-                    let mut buf = [0.0f64; 2];
-                    _mm_storeu_pd(buf.as_mut_ptr(), vsum);
-                    let mut sum = buf[0] + buf[1];
-                    while k < cols_a {
-                        sum += row_a[k] * bt_row[k];
-                        k += 1;
-                    }
-                    *out_cell = sum;
+    Ok(simd_matmul_flat(&Matrix::from_rows(a), &Matrix::from_rows(b)).into_rows())
+}
+
+/// Product against a transposed `b`, so every output cell is a
+/// dot product of two contiguous slices. Large products go to the packed
+/// kernel in [`gemm`].
+fn simd_matmul_flat(a: &Matrix, b: &Matrix) -> Matrix {
+    if a.rows * a.cols * b.cols > gemm::PACKED_GEMM_MIN_WORK {
+        return gemm::gemm_packed(a, b);
+    }
+    let inner = a.cols;
+    let mut out = vec![0.0; a.rows * b.cols];
+    scratch::with_buffer(&scratch::TRANSPOSED, |bt| {
+        bt.clear();
+        bt.resize(b.data.len(), 0.0);
+        transpose_into(&b.data, b.rows, b.cols, bt);
+        let bt = &*bt;
+        let row_work = inner * b.cols;
+        let kernel = |first: usize, block: &mut [f64]| {
+            for (i, out_row) in block.chunks_exact_mut(b.cols).enumerate() {
+                let row_a = a.row(first + i);
+                for (bt_row, out_cell) in bt.chunks_exact(inner).zip(out_row.iter_mut()) {
+                    *out_cell = dot(row_a, bt_row);
                 }
             }
-            #[cfg(not(target_arch = "x86_64"))]
-            {
-                for (bt_row, out_cell) in bt.iter().zip(out_row.iter_mut()) {
-                    let mut sum = 0.0;
-                    for (val_a, val_b) in row_a.iter().zip(bt_row.iter()) {
-                        sum += val_a * val_b;
-                    }
-                    *out_cell = sum;
-                }
+        };
+        for_row_blocks(&mut out, b.cols, 0, row_work, PARALLEL_MIN_WORK, &kernel);
+    });
+    Matrix {
+        data: out,
+        rows: a.rows,
+        cols: b.cols,
+    }
+}
+
+type DotFn = unsafe fn(&[f64], &[f64]) -> f64;
+
+static DOT: OnceLock<DotFn> = OnceLock::new();
+
+/// Dot product of two equal-length slices with the widest kernel this CPU
+/// supports, chosen on first use.
+#[inline]
+fn dot(a: &[f64], b: &[f64]) -> f64 {
+    let kernel = DOT.get_or_init(|| {
+        #[cfg(target_arch = "x86_64")]
+        if is_x86_feature_detected!("avx2") && is_x86_feature_detected!("fma") {
+            return dot_fma as DotFn;
+        }
+        dot_baseline as DotFn
+    });
+    // SAFETY: the kernel's CPU features were detected before it was chosen.
+    unsafe { kernel(a, b) }
+}
+
+/// SSE2 (x86_64 baseline) or scalar dot product, two lanes at a time.
+fn dot_baseline(a: &[f64], b: &[f64]) -> f64 {
+    let n = a.len().min(b.len());
+    #[cfg(target_arch = "x86_64")]
+    unsafe {
+        let mut k = 0;
+        let mut vsum = _mm_set1_pd(0.0);
+        while k + 2 <= n {
+            let va = _mm_loadu_pd(a.as_ptr().add(k));
+            let vb = _mm_loadu_pd(b.as_ptr().add(k));
+            vsum = _mm_add_pd(vsum, _mm_mul_pd(va, vb));
+            k += 2;
+        }
+        let mut buf = [0.0f64; 2];
+        _mm_storeu_pd(buf.as_mut_ptr(), vsum);
+        let mut sum = buf[0] + buf[1];
+        while k < n {
+            sum += a[k] * b[k];
+            k += 1;
+        }
+        sum
+    }
+    #[cfg(not(target_arch = "x86_64"))]
+    {
+        a[..n].iter().zip(&b[..n]).map(|(x, y)| x * y).sum()
+    }
+}
+
+/// AVX2 + FMA dot product.
+///
+/// Four independent accumulators keep four FMAs in flight, so the loop is
+/// bound by load throughput rather than by the latency of a single
+/// accumulator chain.
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2,fma")]
+unsafe fn dot_fma(a: &[f64], b: &[f64]) -> f64 {
+    let n = a.len().min(b.len());
+    unsafe {
+        let (pa, pb) = (a.as_ptr(), b.as_ptr());
+        let mut acc = [_mm256_setzero_pd(); 4];
+        let mut k = 0;
+        while k + 16 <= n {
+            for (lane, sum) in acc.iter_mut().enumerate() {
+                let off = k + 4 * lane;
+                let (va, vb) = (_mm256_loadu_pd(pa.add(off)), _mm256_loadu_pd(pb.add(off)));
+                *sum = _mm256_fmadd_pd(va, vb, *sum);
             }
-            out_row
-        })
-        .collect();
+            k += 16;
+        }
+        while k + 4 <= n {
+            let (va, vb) = (_mm256_loadu_pd(pa.add(k)), _mm256_loadu_pd(pb.add(k)));
+            acc[0] = _mm256_fmadd_pd(va, vb, acc[0]);
+            k += 4;
+        }
+        let pairs = (_mm256_add_pd(acc[0], acc[1]), _mm256_add_pd(acc[2], acc[3]));
+        let mut buf = [0.0f64; 4];
+        _mm256_storeu_pd(buf.as_mut_ptr(), _mm256_add_pd(pairs.0, pairs.1));
+        let mut sum = (buf[0] + buf[1]) + (buf[2] + buf[3]);
+        while k < n {
+            sum += a[k] * b[k];
+            k += 1;
+        }
+        sum
+    }
+}
+
+/// Single-precision counterpart of [`simd_matmul`] over flat row-major data.
+///
+/// `a` is `rows_a x cols_a` and `b` is `rows_b x cols_b`; the result is
+/// `rows_a x cols_b`. Each vector register holds twice as many `f32` lanes,
+/// so callers that can tolerate single-precision rounding get roughly twice
+/// the throughput of the `f64` kernel.
+pub fn simd_matmul_f32(
+    a: &[f32],
+    (rows_a, cols_a): (usize, usize),
+    b: &[f32],
+    (rows_b, cols_b): (usize, usize),
+) -> Result<Vec<f32>, ForziumError> {
+    if rows_a * cols_a == 0 || rows_b * cols_b == 0 {
+        return Err(ForziumError::Validation("empty tensor".into()));
+    }
+    if a.len() != rows_a * cols_a || b.len() != rows_b * cols_b || cols_a != rows_b {
+        return Err(ForziumError::Validation("shape mismatch".into()));
+    }
+    check_tensor_size(rows_a, cols_a, "simd_matmul").map_err(ForziumError::ResourceLimit)?;
+    check_tensor_size(rows_b, cols_b, "simd_matmul").map_err(ForziumError::ResourceLimit)?;
+
+    // Try to acquire operation guard
+    let _op_guard = OpGuard::try_new().ok_or_else(|| {
+        ForziumError::ResourceLimit(format!(
+            "Maximum concurrent operations ({}) reached",
+            RESOURCE_LIMITS
+                .max_concurrent_ops
+                .load(std::sync::atomic::Ordering::SeqCst)
+        ))
+    })?;
+
+    let inner = cols_a;
+    let mut bt = vec![0.0f32; b.len()];
+    for (k, row) in b.chunks_exact(cols_b).enumerate() {
+        for (j, &value) in row.iter().enumerate() {
+            bt[j * inner + k] = value;
+        }
+    }
+    let mut out = vec![0.0f32; rows_a * cols_b];
+    let row_work = inner * cols_b;
+    let kernel = |first: usize, block: &mut [f32]| {
+        for (i, out_row) in block.chunks_exact_mut(cols_b).enumerate() {
+            let row_a = &a[(first + i) * inner..(first + i + 1) * inner];
+            for (bt_row, out_cell) in bt.chunks_exact(inner).zip(out_row.iter_mut()) {
+                *out_cell = dot_f32(row_a, bt_row);
+            }
+        }
+    };
+    // Twice the lanes per instruction: split at twice the f64 work.
+    for_row_blocks(
+        &mut out,
+        cols_b,
+        0,
+        row_work,
+        2 * PARALLEL_MIN_WORK,
+        &kernel,
+    );
     Ok(out)
 }
 
+type DotF32Fn = unsafe fn(&[f32], &[f32]) -> f32;
+
+static DOT_F32: OnceLock<DotF32Fn> = OnceLock::new();
+
+/// `f32` dot product of two equal-length slices with the widest kernel this
+/// CPU supports, chosen on first use.
+#[inline]
+fn dot_f32(a: &[f32], b: &[f32]) -> f32 {
+    let kernel = DOT_F32.get_or_init(|| {
+        #[cfg(target_arch = "x86_64")]
+        {
+            if is_x86_feature_detected!("avx512f") {
+                return dot_f32_avx512 as DotF32Fn;
+            }
+            if is_x86_feature_detected!("avx2") && is_x86_feature_detected!("fma") {
+                return dot_f32_fma as DotF32Fn;
+            }
+        }
+        dot_f32_scalar as DotF32Fn
+    });
+    // SAFETY: the kernel's CPU features were detected before it was chosen.
+    unsafe { kernel(a, b) }
+}
+
+fn dot_f32_scalar(a: &[f32], b: &[f32]) -> f32 {
+    a.iter().zip(b).map(|(x, y)| x * y).sum()
+}
+
+/// AVX2 + FMA `f32` dot product, 8 lanes with four accumulators.
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2,fma")]
+unsafe fn dot_f32_fma(a: &[f32], b: &[f32]) -> f32 {
+    let n = a.len().min(b.len());
+    unsafe {
+        let (pa, pb) = (a.as_ptr(), b.as_ptr());
+        let mut acc = [_mm256_setzero_ps(); 4];
+        let mut k = 0;
+        while k + 32 <= n {
+            for (lane, sum) in acc.iter_mut().enumerate() {
+                let off = k + 8 * lane;
+                let (va, vb) = (_mm256_loadu_ps(pa.add(off)), _mm256_loadu_ps(pb.add(off)));
+                *sum = _mm256_fmadd_ps(va, vb, *sum);
+            }
+            k += 32;
+        }
+        while k + 8 <= n {
+            let (va, vb) = (_mm256_loadu_ps(pa.add(k)), _mm256_loadu_ps(pb.add(k)));
+            acc[0] = _mm256_fmadd_ps(va, vb, acc[0]);
+            k += 8;
+        }
+        let pairs = (_mm256_add_ps(acc[0], acc[1]), _mm256_add_ps(acc[2], acc[3]));
+        let mut buf = [0.0f32; 8];
+        _mm256_storeu_ps(buf.as_mut_ptr(), _mm256_add_ps(pairs.0, pairs.1));
+        let mut sum: f32 = buf.iter().sum();
+        while k < n {
+            sum += a[k] * b[k];
+            k += 1;
+        }
+        sum
+    }
+}
+
+/// AVX-512 `f32` dot product, 16 lanes with four accumulators.
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx512f")]
+unsafe fn dot_f32_avx512(a: &[f32], b: &[f32]) -> f32 {
+    let n = a.len().min(b.len());
+    unsafe {
+        let (pa, pb) = (a.as_ptr(), b.as_ptr());
+        let mut acc = [_mm512_setzero_ps(); 4];
+        let mut k = 0;
+        while k + 64 <= n {
+            for (lane, sum) in acc.iter_mut().enumerate() {
+                let off = k + 16 * lane;
+                let (va, vb) = (_mm512_loadu_ps(pa.add(off)), _mm512_loadu_ps(pb.add(off)));
+                *sum = _mm512_fmadd_ps(va, vb, *sum);
+            }
+            k += 64;
+        }
+        while k + 16 <= n {
+            let (va, vb) = (_mm512_loadu_ps(pa.add(k)), _mm512_loadu_ps(pb.add(k)));
+            acc[0] = _mm512_fmadd_ps(va, vb, acc[0]);
+            k += 16;
+        }
+        let pairs = (_mm512_add_ps(acc[0], acc[1]), _mm512_add_ps(acc[2], acc[3]));
+        let mut sum = _mm512_reduce_add_ps(_mm512_add_ps(pairs.0, pairs.1));
+        while k < n {
+            sum += a[k] * b[k];
+            k += 1;
+        }
+        sum
+    }
+}
+
 pub fn elementwise_add(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<Vec<Vec<f64>>, ForziumError> {
-    validate_same_shape(a, b, "elementwise_add")?;
+    let (rows, cols) = validate_same_shape(a, b, "elementwise_add")?;
 
     // Try to acquire operation guard
     let _op_guard = OpGuard::try_new().ok_or_else(|| {
@@ -205,17 +749,12 @@ pub fn elementwise_add(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<Vec<Vec<f64>>,
         ))
     })?;
 
-    Ok(a.par_iter()
-        .zip(b.par_iter())
-        .map(|(row_a, row_b)| {
-            let _guard = rayon_metrics::track_task();
-            row_a
-                .par_iter()
-                .zip(row_b.par_iter())
-                .map(|(val_a, val_b)| val_a + val_b)
-                .collect()
-        })
-        .collect())
+    let add = |x: &[f64], y: &[f64], out: &mut [f64]| {
+        for (val_out, (val_a, val_b)) in out.iter_mut().zip(x.iter().zip(y)) {
+            *val_out = val_a + val_b;
+        }
+    };
+    Ok(zip_flat(a, b, rows, cols, PARALLEL_MIN_WORK, add))
 }
 
 pub fn simd_elementwise_add(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<Vec<Vec<f64>>, ForziumError> {
@@ -230,38 +769,77 @@ pub fn simd_elementwise_add(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<Vec<Vec<f6
                 .load(std::sync::atomic::Ordering::SeqCst)
         ))
     })?;
-    let mut out = vec![vec![0.0; cols]; rows];
+    let min_work = SIMD_ADD_PARALLEL_MIN_WORK;
+    Ok(zip_flat(a, b, rows, cols, min_work, add_rows_simd))
+}
+
+type AddRowsFn = unsafe fn(&[f64], &[f64], &mut [f64]);
+
+static ADD_ROWS: OnceLock<AddRowsFn> = OnceLock::new();
+
+/// `out = a + b` over equal-length slices with the widest kernel this CPU
+/// supports, chosen on first use.
+#[inline]
+fn add_rows_simd(a: &[f64], b: &[f64], out: &mut [f64]) {
+    let kernel = ADD_ROWS.get_or_init(|| {
+        #[cfg(target_arch = "x86_64")]
+        if is_x86_feature_detected!("avx512f") {
+            return add_rows_avx512 as AddRowsFn;
+        }
+        add_rows_baseline as AddRowsFn
+    });
+    debug_assert!(a.len() >= out.len() && b.len() >= out.len());
+    // SAFETY: the kernel's CPU features were detected before it was chosen.
+    unsafe { kernel(a, b, out) }
+}
+
+/// SSE2 (x86_64 baseline) or scalar row add, two lanes at a time.
+fn add_rows_baseline(a: &[f64], b: &[f64], out: &mut [f64]) {
+    let cols = out.len();
     #[cfg(target_arch = "x86_64")]
     unsafe {
-        for r in 0..rows {
-            let mut c = 0;
-            while c + 2 <= cols {
-                let va = _mm_loadu_pd(a[r].as_ptr().add(c));
-                let vb = _mm_loadu_pd(b[r].as_ptr().add(c));
-                let vc = _mm_add_pd(va, vb);
-                _mm_storeu_pd(out[r].as_mut_ptr().add(c), vc);
-                c += 2;
-            }
-            while c < cols {
-                out[r][c] = a[r][c] + b[r][c];
-                c += 1;
-            }
+        let mut c = 0;
+        while c + 2 <= cols {
+            let va = _mm_loadu_pd(a.as_ptr().add(c));
+            let vb = _mm_loadu_pd(b.as_ptr().add(c));
+            _mm_storeu_pd(out.as_mut_ptr().add(c), _mm_add_pd(va, vb));
+            c += 2;
+        }
+        while c < cols {
+            out[c] = a[c] + b[c];
+            c += 1;
         }
     }
     #[cfg(not(target_arch = "x86_64"))]
     {
-        for (row_out, (row_a, row_b)) in out.iter_mut().zip(a.iter().zip(b.iter())) {
-            for (val_out, (val_a, val_b)) in row_out.iter_mut().zip(row_a.iter().zip(row_b.iter()))
-            {
-                *val_out = val_a + val_b;
-            }
+        for (val_out, (val_a, val_b)) in out.iter_mut().zip(a.iter().zip(b)) {
+            *val_out = val_a + val_b;
+        }
+    }
+}
+
+/// AVX-512 row add, eight lanes at a time.
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx512f")]
+unsafe fn add_rows_avx512(a: &[f64], b: &[f64], out: &mut [f64]) {
+    let cols = out.len();
+    unsafe {
+        let mut c = 0;
+        while c + 8 <= cols {
+            let va = _mm512_loadu_pd(a.as_ptr().add(c));
+            let vb = _mm512_loadu_pd(b.as_ptr().add(c));
+            _mm512_storeu_pd(out.as_mut_ptr().add(c), _mm512_add_pd(va, vb));
+            c += 8;
+        }
+        while c < cols {
+            out[c] = a[c] + b[c];
+            c += 1;
         }
     }
-    Ok(out)
 }
 
 pub fn hadamard(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<Vec<Vec<f64>>, ForziumError> {
-    validate_same_shape(a, b, "hadamard")?;
+    let (rows, cols) = validate_same_shape(a, b, "hadamard")?;
 
     // Try to acquire operation guard
     let _op_guard = OpGuard::try_new().ok_or_else(|| {
@@ -273,20 +851,14 @@ pub fn hadamard(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<Vec<Vec<f64>>, Forzium
         ))
     })?;
 
-    Ok(a.par_iter()
-        .zip(b.par_iter())
-        .map(|(row_a, row_b)| {
-            let _guard = rayon_metrics::track_task();
-            row_a
-                .par_iter()
-                .zip(row_b.par_iter())
-                .map(|(val_a, val_b)| val_a * val_b)
-                .collect()
-        })
-        .collect())
+    let mul = |x: &[f64], y: &[f64], out: &mut [f64]| {
+        for (val_out, (val_a, val_b)) in out.iter_mut().zip(x.iter().zip(y)) {
+            *val_out = val_a * val_b;
+        }
+    };
+    Ok(zip_flat(a, b, rows, cols, PARALLEL_MIN_WORK, mul))
 }
 
-#[allow(clippy::needless_range_loop)]
 pub fn conv2d(input: &[Vec<f64>], kernel: &[Vec<f64>]) -> Result<Vec<Vec<f64>>, ForziumError> {
     let (rows, cols) = validate_matrix(input, "conv2d")?;
     let (krows, kcols) = validate_matrix(kernel, "conv2d")?;
@@ -308,44 +880,95 @@ pub fn conv2d(input: &[Vec<f64>], kernel: &[Vec<f64>]) -> Result<Vec<Vec<f64>>,
     let mut out = vec![vec![0.0; out_cols]; out_rows];
     out.par_iter_mut().enumerate().for_each(|(r, out_row)| {
         let _guard = rayon_metrics::track_task();
-        for c in 0..out_cols {
-            let mut sum = 0.0;
-            #[cfg(target_arch = "x86_64")]
-            unsafe {
-                for kr in 0..krows {
-                    let mut kc = 0;
-                    let mut vsum = _mm_set1_pd(0.0);
-                    while kc + 2 <= kcols {
-                        let inp = _mm_loadu_pd(input[r + kr].as_ptr().add(c + kc));
-                        let ker = _mm_loadu_pd(kernel[kr].as_ptr().add(kc));
-                        let prod = _mm_mul_pd(inp, ker);
-                        vsum = _mm_add_pd(vsum, prod);
-                        kc += 2;
-                    }
-                    let mut buf = [0.0f64; 2];
-                    _mm_storeu_pd(buf.as_mut_ptr(), vsum);
-                    sum += buf[0] + buf[1];
-                    while kc < kcols {
-                        sum += input[r + kr][c + kc] * kernel[kr][kc];
-                        kc += 1;
-                    }
+        let window = &input[r..r + krows];
+        match (krows, kcols) {
+            (1, 1) => conv_row_1x1(&window[0], kernel[0][0], out_row),
+            (2, 2) => conv_row_2x2(window, kernel, out_row),
+            (3, 3) => conv_row_3x3(window, kernel, out_row),
+            _ => conv_row_generic(window, kernel, out_row),
+        }
+    });
+    Ok(out)
+}
+
+// The fixed-size kernels below keep every weight in a local so the hot loop
+// only loads input values. Each one adds its products in the same order as
+// `conv_row_generic` (pairs first, then the odd column, row by row), so all
+// paths return identical results.
+
+#[inline(always)]
+fn conv_row_1x1(row: &[f64], k: f64, out_row: &mut [f64]) {
+    for (out_val, x) in out_row.iter_mut().zip(row) {
+        *out_val = x * k;
+    }
+}
+
+#[inline(always)]
+fn conv_row_2x2(window: &[Vec<f64>], kernel: &[Vec<f64>], out_row: &mut [f64]) {
+    let (i0, i1) = (&window[0], &window[1]);
+    let (k00, k01) = (kernel[0][0], kernel[0][1]);
+    let (k10, k11) = (kernel[1][0], kernel[1][1]);
+    for (c, out_val) in out_row.iter_mut().enumerate() {
+        let top = i0[c] * k00 + i0[c + 1] * k01;
+        *out_val = top + (i1[c] * k10 + i1[c + 1] * k11);
+    }
+}
+
+#[inline(always)]
+fn conv_row_3x3(window: &[Vec<f64>], kernel: &[Vec<f64>], out_row: &mut [f64]) {
+    let (i0, i1, i2) = (&window[0], &window[1], &window[2]);
+    let (k00, k01, k02) = (kernel[0][0], kernel[0][1], kernel[0][2]);
+    let (k10, k11, k12) = (kernel[1][0], kernel[1][1], kernel[1][2]);
+    let (k20, k21, k22) = (kernel[2][0], kernel[2][1], kernel[2][2]);
+    for (c, out_val) in out_row.iter_mut().enumerate() {
+        let mut sum = i0[c] * k00 + i0[c + 1] * k01;
+        sum += i0[c + 2] * k02;
+        sum += i1[c] * k10 + i1[c + 1] * k11;
+        sum += i1[c + 2] * k12;
+        sum += i2[c] * k20 + i2[c + 1] * k21;
+        sum += i2[c + 2] * k22;
+        *out_val = sum;
+    }
+}
+
+#[allow(clippy::needless_range_loop)]
+fn conv_row_generic(window: &[Vec<f64>], kernel: &[Vec<f64>], out_row: &mut [f64]) {
+    let kcols = kernel[0].len();
+    for c in 0..out_row.len() {
+        let mut sum = 0.0;
+        #[cfg(target_arch = "x86_64")]
+        unsafe {
+            for (row, krow) in window.iter().zip(kernel) {
+                let mut kc = 0;
+                let mut vsum = _mm_set1_pd(0.0);
+                while kc + 2 <= kcols {
+                    let inp = _mm_loadu_pd(row.as_ptr().add(c + kc));
+                    let ker = _mm_loadu_pd(krow.as_ptr().add(kc));
+                    let prod = _mm_mul_pd(inp, ker);
+                    vsum = _mm_add_pd(vsum, prod);
+                    kc += 2;
+                }
+                let mut buf = [0.0f64; 2];
+                _mm_storeu_pd(buf.as_mut_ptr(), vsum);
+                sum += buf[0] + buf[1];
+                while kc < kcols {
+                    sum += row[c + kc] * krow[kc];
+                    kc += 1;
                 }
             }
-            #[cfg(not(target_arch = "x86_64"))]
-            {
-                for kr in 0..krows {
-                    for kc in 0..kcols {
-                        sum += input[r + kr][c + kc] * kernel[kr][kc];
-                    }
+        }
+        #[cfg(not(target_arch = "x86_64"))]
+        {
+            for (row, krow) in window.iter().zip(kernel) {
+                for kc in 0..kcols {
+                    sum += row[c + kc] * krow[kc];
                 }
             }
-            out_row[c] = sum;
         }
-    });
-    Ok(out)
+        out_row[c] = sum;
+    }
 }
 
-#[allow(clippy::needless_range_loop)]
 pub fn max_pool2d(input: &[Vec<f64>], size: usize) -> Result<Vec<Vec<f64>>, ForziumError> {
     let (rows, cols) = validate_matrix(input, "max_pool2d")?;
     if size == 0 || rows % size != 0 || cols % size != 0 {
@@ -366,22 +989,72 @@ pub fn max_pool2d(input: &[Vec<f64>], size: usize) -> Result<Vec<Vec<f64>>, Forz
     let mut out = vec![vec![0.0; out_cols]; out_rows];
     out.par_iter_mut().enumerate().for_each(|(r, out_row)| {
         let _guard = rayon_metrics::track_task();
-        for c in 0..out_cols {
-            let mut m = f64::NEG_INFINITY;
-            for pr in 0..size {
-                for pc in 0..size {
-                    let val = input[r * size + pr][c * size + pc];
-                    if val > m {
-                        m = val;
-                    }
-                }
-            }
-            out_row[c] = m;
+        let window_rows = &input[r * size..(r + 1) * size];
+        if size == 2 {
+            pool_row_2x2(&window_rows[0], &window_rows[1], out_row);
+            return;
+        }
+        for (c, out_val) in out_row.iter_mut().enumerate() {
+            let span = c * size..(c + 1) * size;
+            *out_val = window_rows
+                .iter()
+                .flat_map(|row| &row[span.clone()])
+                .fold(f64::NEG_INFINITY, |m, &v| m.max(v));
         }
     });
     Ok(out)
 }
 
+/// 2x2 max pooling over one pair of input rows.
+///
+/// NaNs are skipped like in the general `f64::max` path: the running maximum
+/// is always the second operand of `max_pd`, which is what it returns when
+/// the new value is NaN.
+#[inline]
+fn pool_row_2x2(top: &[f64], bottom: &[f64], out_row: &mut [f64]) {
+    #[cfg(target_arch = "x86_64")]
+    unsafe {
+        let floor = _mm_set1_pd(f64::NEG_INFINITY);
+        for (c, out_val) in out_row.iter_mut().enumerate() {
+            let m = _mm_max_pd(_mm_loadu_pd(top.as_ptr().add(2 * c)), floor);
+            let m = _mm_max_pd(_mm_loadu_pd(bottom.as_ptr().add(2 * c)), m);
+            let mut lanes = [0.0f64; 2];
+            _mm_storeu_pd(lanes.as_mut_ptr(), m);
+            *out_val = lanes[0].max(lanes[1]);
+        }
+    }
+    #[cfg(not(target_arch = "x86_64"))]
+    {
+        for (c, out_val) in out_row.iter_mut().enumerate() {
+            *out_val = [top[2 * c], top[2 * c + 1], bottom[2 * c], bottom[2 * c + 1]]
+                .into_iter()
+                .fold(f64::NEG_INFINITY, f64::max);
+        }
+    }
+}
+
+/// Apply several operations to the same matrix in one call.
+///
+/// Each `(name, arg)` spec is applied to `m` independently: `multiply` and
+/// `add` use `arg` as their scalar, while `transpose` and `matmul` (`m · m`)
+/// ignore it.
+pub fn batch_ops(
+    m: &[Vec<f64>],
+    ops: &[(String, f64)],
+) -> Result<Vec<Vec<Vec<f64>>>, ForziumError> {
+    ops.iter()
+        .map(|(name, arg)| match name.as_str() {
+            "multiply" => multiply(m, *arg),
+            "add" => add(m, *arg),
+            "transpose" => transpose(m),
+            "matmul" => matmul(m, m),
+            other => Err(ForziumError::Validation(format!(
+                "unsupported operation: {other}"
+            ))),
+        })
+        .collect()
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -409,6 +1082,121 @@ mod tests {
         assert_eq!(res, vec![vec![1.0], vec![2.0], vec![3.0]]);
     }
 
+    #[test]
+    fn transpose_matches_naive_for_odd_shapes() {
+        for &(rows, cols) in &[(1, 1), (3, 5), (4, 4), (9, 7), (37, 130), (130, 37)] {
+            let m: Vec<Vec<f64>> = (0..rows)
+                .map(|r| (0..cols).map(|c| (r * cols + c) as f64).collect())
+                .collect();
+            let expected: Vec<Vec<f64>> = (0..cols)
+                .map(|c| (0..rows).map(|r| m[r][c]).collect())
+                .collect();
+            assert_eq!(transpose(&m).unwrap(), expected);
+            assert_eq!(transpose(&expected).unwrap(), m);
+        }
+    }
+
+    #[test]
+    fn max_pool2d_specialized_and_general_paths() {
+        let m = vec![
+            vec![1.0, -2.0, 3.0, 4.0],
+            vec![-5.0, 6.0, f64::NAN, -8.0],
+            vec![-9.0, -10.0, f64::NAN, f64::NAN],
+            vec![-13.0, -14.0, f64::NAN, f64::NAN],
+        ];
+        assert_eq!(
+            max_pool2d(&m, 2).unwrap(),
+            vec![vec![6.0, 4.0], vec![-9.0, f64::NEG_INFINITY]]
+        );
+        assert_eq!(max_pool2d(&m, 4).unwrap(), vec![vec![6.0]]);
+        let row = vec![vec![3.0, 1.0, 2.0, 7.0, 5.0, 6.0]];
+        assert_eq!(max_pool2d(&row, 1).unwrap(), row);
+    }
+
+    #[test]
+    fn conv2d_specialized_kernels_match_generic() {
+        let input: Vec<Vec<f64>> = (0..7)
+            .map(|r| (0..9).map(|c| ((r * 9 + c) as f64 * 0.37).sin()).collect())
+            .collect();
+        for size in 1..=3 {
+            let kernel: Vec<Vec<f64>> = (0..size)
+                .map(|r| {
+                    (0..size)
+                        .map(|c| (r * size + c) as f64 * 0.5 - 1.0)
+                        .collect()
+                })
+                .collect();
+            let out = conv2d(&input, &kernel).unwrap();
+            let mut expected = vec![vec![0.0; 10 - size]; 8 - size];
+            for (r, row) in expected.iter_mut().enumerate() {
+                conv_row_generic(&input[r..r + size], &kernel, row);
+            }
+            assert_eq!(out, expected, "kernel {size}x{size}");
+        }
+    }
+
+    #[test]
+    fn transpose_flat_matches_row_transpose() {
+        let m = Matrix::from_flat((0..6).map(f64::from).collect(), 2, 3).unwrap();
+        let t = transpose_flat(&m).unwrap();
+        assert_eq!((t.rows, t.cols), (3, 2));
+        assert_eq!(t.data, vec![0.0, 3.0, 1.0, 4.0, 2.0, 5.0]);
+        let empty = Matrix::from_flat(Vec::new(), 0, 3).unwrap();
+        assert!(matches!(
+            transpose_flat(&empty),
+            Err(ForziumError::Validation(_))
+        ));
+    }
+
+    #[test]
+    fn add_row_kernels_agree() {
+        let a: Vec<f64> = (0..19).map(|v| v as f64 * 1.25).collect();
+        let b: Vec<f64> = (0..19).map(|v| 3.0 - v as f64).collect();
+        let expected: Vec<f64> = a.iter().zip(&b).map(|(x, y)| x + y).collect();
+        let mut out = vec![0.0; 19];
+        add_rows_baseline(&a, &b, &mut out);
+        assert_eq!(out, expected);
+        out.fill(0.0);
+        add_rows_simd(&a, &b, &mut out);
+        assert_eq!(out, expected);
+    }
+
+    #[test]
+    fn dot_kernels_agree() {
+        for n in 0..40 {
+            let a: Vec<f64> = (0..n).map(|i| (i % 7) as f64 - 3.0).collect();
+            let b: Vec<f64> = (0..n).map(|i| (i % 5) as f64).collect();
+            let expected: f64 = a.iter().zip(&b).map(|(x, y)| x * y).sum();
+            assert_eq!(dot_baseline(&a, &b), expected, "baseline, n = {n}");
+            assert_eq!(dot(&a, &b), expected, "dispatched, n = {n}");
+        }
+    }
+
+    #[test]
+    fn simd_matmul_f32_matches_f64() {
+        let (m, k, n) = (9, 70, 5);
+        let a: Vec<Vec<f64>> = (0..m)
+            .map(|i| (0..k).map(|j| ((i * k + j) % 13) as f64 * 0.25).collect())
+            .collect();
+        let b: Vec<Vec<f64>> = (0..k)
+            .map(|i| (0..n).map(|j| ((i + 3 * j) % 7) as f64 - 3.0).collect())
+            .collect();
+        let flat =
+            |rows: &[Vec<f64>]| -> Vec<f32> { rows.iter().flatten().map(|&v| v as f32).collect() };
+        let single = simd_matmul_f32(&flat(&a), (m, k), &flat(&b), (k, n)).unwrap();
+        let double = matmul(&a, &b).unwrap();
+        for (got, want) in single.iter().zip(double.iter().flatten()) {
+            assert!((f64::from(*got) - want).abs() <= 1e-5 * want.abs().max(1.0));
+        }
+        #[cfg(target_arch = "x86_64")]
+        if is_x86_feature_detected!("avx2") && is_x86_feature_detected!("fma") {
+            let v: Vec<f32> = (0..45).map(|i| (i % 9) as f32).collect();
+            // SAFETY: AVX2 and FMA support were checked above.
+            assert_eq!(unsafe { dot_f32_fma(&v, &v) }, dot_f32_scalar(&v, &v));
+        }
+        assert!(simd_matmul_f32(&[1.0; 6], (2, 3), &[1.0; 6], (2, 3)).is_err());
+    }
+
     #[test]
     fn matmul_shape_mismatch() {
         let a = vec![vec![1.0, 2.0]];
@@ -417,6 +1205,114 @@ mod tests {
         matches!(err, ForziumError::Validation(_));
     }
 
+    #[test]
+    fn matrix_flattens_and_restores_rows() {
+        let rows = vec![vec![1.0, 2.0, 3.0], vec![4.0, 5.0, 6.0]];
+        let m = Matrix::from_rows(&rows);
+        assert_eq!((m.rows, m.cols), (2, 3));
+        assert_eq!(m.data, vec![1.0, 2.0, 3.0, 4.0, 5.0, 6.0]);
+        assert_eq!(m.row(1), &[4.0, 5.0, 6.0]);
+        assert_eq!(
+            m.transposed().into_rows(),
+            vec![vec![1.0, 4.0], vec![2.0, 5.0], vec![3.0, 6.0]]
+        );
+        assert_eq!(m.into_rows(), rows);
+        assert!(Matrix::from_flat(vec![1.0; 5], 2, 3).is_err());
+    }
+
+    #[test]
+    fn matmul_non_square_flat() {
+        let a = vec![vec![1.0, 2.0, 3.0], vec![4.0, 5.0, 6.0]];
+        let b = vec![vec![7.0, 8.0], vec![9.0, 10.0], vec![11.0, 12.0]];
+        let expected = vec![vec![58.0, 64.0], vec![139.0, 154.0]];
+        assert_eq!(matmul(&a, &b).unwrap(), expected);
+        assert_eq!(simd_matmul(&a, &b).unwrap(), expected);
+    }
+
+    #[test]
+    fn simd_matmul_packed_path_matches_matmul() {
+        let n = 70;
+        let a: Vec<Vec<f64>> = (0..n)
+            .map(|i| (0..n).map(|j| ((i * n + j) % 11) as f64).collect())
+            .collect();
+        let regular = matmul(&a, &a).unwrap();
+        let simd = simd_matmul(&a, &a).unwrap();
+        assert_eq!(regular, simd);
+    }
+
+    #[test]
+    fn row_blocks_cover_every_row_once() {
+        for &(rows, min_work) in &[(1, 0), (7, 0), (64, 10), (64, usize::MAX)] {
+            let mut out = vec![0usize; rows * 3];
+            for_row_blocks(&mut out, 3, 0, 1, min_work, &|first, block| {
+                for (i, row) in block.chunks_exact_mut(3).enumerate() {
+                    row.iter_mut().for_each(|v| *v += first + i + 1);
+                }
+            });
+            let expected: Vec<usize> = (1..=rows).flat_map(|r| [r; 3]).collect();
+            assert_eq!(out, expected);
+        }
+    }
+
+    #[test]
+    fn elementwise_kernels_match_per_element_ops() {
+        let a: Vec<Vec<f64>> = (0..90)
+            .map(|i| (0..70).map(|j| (i * 70 + j) as f64).collect())
+            .collect();
+        let b: Vec<Vec<f64>> = a
+            .iter()
+            .map(|r| r.iter().map(|v| v * 0.5).collect())
+            .collect();
+        let sum: Vec<Vec<f64>> = a
+            .iter()
+            .zip(&b)
+            .map(|(ra, rb)| ra.iter().zip(rb).map(|(x, y)| x + y).collect())
+            .collect();
+        assert_eq!(elementwise_add(&a, &b).unwrap(), sum);
+        assert_eq!(simd_elementwise_add(&a, &b).unwrap(), sum);
+        assert_eq!(hadamard(&a, &a).unwrap()[3][5], a[3][5] * a[3][5]);
+
+        // Narrow rows whose width is not a multiple of any vector width.
+        let narrow = vec![vec![1.0, 2.0, 3.0]; 5];
+        let doubled = vec![vec![2.0, 4.0, 6.0]; 5];
+        assert_eq!(simd_elementwise_add(&narrow, &narrow).unwrap(), doubled);
+    }
+
+    #[test]
+    fn multiply_single_element_uses_scalar_path() {
+        let res = multiply(&[vec![42.0]], 2.0).unwrap();
+        assert_eq!(res, vec![vec![multiply_scalar(42.0, 2.0)]]);
+        assert_eq!(res, vec![vec![84.0]]);
+    }
+
+    #[test]
+    fn batch_ops_applies_each_op_to_input() {
+        let m = vec![vec![42.0]];
+        let ops = vec![
+            ("multiply".to_string(), 2.0),
+            ("add".to_string(), 10.0),
+            ("transpose".to_string(), 0.0),
+            ("matmul".to_string(), 0.0),
+        ];
+        let res = batch_ops(&m, &ops).unwrap();
+        assert_eq!(
+            res,
+            vec![
+                vec![vec![84.0]],
+                vec![vec![52.0]],
+                vec![vec![42.0]],
+                vec![vec![1764.0]],
+            ]
+        );
+    }
+
+    #[test]
+    fn batch_ops_rejects_unknown_op() {
+        let m = vec![vec![1.0]];
+        let err = batch_ops(&m, &[("divide".to_string(), 2.0)]).unwrap_err();
+        assert!(matches!(err, ForziumError::Validation(_)));
+    }
+
     #[test]
     fn matmul_parallel_speedup() {
         use rayon::ThreadPoolBuilder;
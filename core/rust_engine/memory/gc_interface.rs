@@ -1,11 +1,25 @@
-//! Bridge for triggering Python's garbage collection from Rust
+//! Bridge for releasing engine-held memory, and optionally collecting
+//! Python garbage, from Python
 
 use pyo3::prelude::*;
 
-/// Force a Python garbage collection cycle.
+use crate::compute::scratch;
+
+/// Release the per-thread kernel scratch buffers and return the bytes freed.
+///
+/// Buffers are dropped on every thread of the global rayon pool and on the
+/// calling thread. Python's cyclic garbage collector only runs when
+/// `include_python` is true, since a full heap sweep costs far more than
+/// the scratch release and reclaims nothing the engine owns.
 #[pyfunction]
-pub fn force_gc(py: Python<'_>) -> PyResult<()> {
-    let gc = py.import("gc")?;
-    gc.call_method0("collect")?;
-    Ok(())
+#[pyo3(signature = (include_python = false))]
+pub fn force_gc(py: Python<'_>, include_python: bool) -> PyResult<u64> {
+    let freed = py.allow_threads(|| {
+        let workers: usize = rayon::broadcast(|_| scratch::release()).into_iter().sum();
+        workers + scratch::release()
+    });
+    if include_python {
+        py.import("gc")?.call_method0("collect")?;
+    }
+    Ok(freed as u64)
 }
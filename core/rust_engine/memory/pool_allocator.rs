@@ -27,7 +27,10 @@ pub struct PoolStats {
 }
 
 /// Allocator that manages thread-safe variable-size memory blocks up to a total capacity.
-#[pyclass(module = "forzium_engine")]
+///
+/// Instances support weak references but carry no `__dict__`; attach extra
+/// state through a Python-side wrapper instead.
+#[pyclass(module = "forzium_engine", weakref)]
 #[derive(Debug, Clone)]
 pub struct PoolAllocator {
     capacity: usize,
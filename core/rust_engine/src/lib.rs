@@ -1,5 +1,6 @@
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyModule};
+use pyo3::types::{PyDict, PyList, PyModule};
 
 pub mod async_compute;
 #[path = "../bindings/mod.rs"]
@@ -15,6 +16,9 @@ pub mod server;
 pub mod validation;
 
 use crate::async_compute::{create_async_compute, AsyncCompute, ComputeHandle};
+use crate::bindings::type_converters::{
+    flat_to_py_buffer, py_matrix_to_flat, py_matrix_to_flat_f32, py_matrix_to_rows,
+};
 use crate::compute::{
     data_transform,
     engine::ComputeEngine,
@@ -33,28 +37,84 @@ use crate::memory::gc_interface::force_gc;
 use crate::server::http_engine::ForziumHttpServer;
 use crate::validation::compute_request::ComputeRequestSchema;
 
+/// Accepts nested lists or 2-D float64/float32 buffers such as NumPy arrays.
 #[pyfunction]
-fn multiply(matrix: Vec<Vec<f64>>, factor: f64) -> PyResult<Vec<Vec<f64>>> {
+fn multiply(matrix: &Bound<'_, PyAny>, factor: f64) -> PyResult<Vec<Vec<f64>>> {
+    let matrix = py_matrix_to_rows(matrix)?;
     tensor_ops::multiply(&matrix, factor).map_err(Into::into)
 }
 
+/// Multiply a single value; the entry point `multiply` uses for 1x1 inputs.
 #[pyfunction]
-fn add(matrix: Vec<Vec<f64>>, addend: f64) -> PyResult<Vec<Vec<f64>>> {
+fn multiply_scalar(value: f64, factor: f64) -> f64 {
+    tensor_ops::multiply_scalar(value, factor)
+}
+
+/// Accepts nested lists or 2-D float64/float32 buffers such as NumPy arrays.
+#[pyfunction]
+fn add(matrix: &Bound<'_, PyAny>, addend: f64) -> PyResult<Vec<Vec<f64>>> {
+    let matrix = py_matrix_to_rows(matrix)?;
     tensor_ops::add(&matrix, addend).map_err(Into::into)
 }
 
+/// Input size, in elements, up to which kernels run with the GIL held;
+/// releasing and re-acquiring it costs more than these inputs take.
+const GIL_RELEASE_MIN_ELEMENTS: usize = 1024;
+
+fn element_count(m: &[Vec<f64>]) -> usize {
+    m.len() * m.first().map_or(0, Vec::len)
+}
+
+/// Run `f` with the GIL released if the inputs hold more than
+/// [`GIL_RELEASE_MIN_ELEMENTS`] values, and inline otherwise.
+fn allow_threads_above<T, F>(py: Python<'_>, elements: usize, f: F) -> T
+where
+    T: Send,
+    F: FnOnce() -> T + Send,
+{
+    if elements > GIL_RELEASE_MIN_ELEMENTS {
+        py.allow_threads(f)
+    } else {
+        f()
+    }
+}
+
+/// Accepts nested lists or 2-D float64/float32 buffers such as NumPy arrays.
 #[pyfunction]
-fn matmul(a: Vec<Vec<f64>>, b: Vec<Vec<f64>>) -> PyResult<Vec<Vec<f64>>> {
-    tensor_ops::matmul(&a, &b).map_err(Into::into)
+fn matmul(py: Python<'_>, a: &Bound<'_, PyAny>, b: &Bound<'_, PyAny>) -> PyResult<Vec<Vec<f64>>> {
+    let a = py_matrix_to_rows(a)?;
+    let b = py_matrix_to_rows(b)?;
+    let elements = element_count(&a) + element_count(&b);
+    allow_threads_above(py, elements, || tensor_ops::matmul(&a, &b)).map_err(Into::into)
 }
 
+/// Accepts nested lists or 2-D float64/float32 buffers such as NumPy arrays.
 #[pyfunction]
-fn simd_matmul(py: Python<'_>, a: Vec<Vec<f64>>, b: Vec<Vec<f64>>) -> PyResult<Vec<Vec<f64>>> {
-    let a_clone = a.clone();
-    let b_clone = b.clone();
+fn simd_matmul(
+    py: Python<'_>,
+    a: &Bound<'_, PyAny>,
+    b: &Bound<'_, PyAny>,
+) -> PyResult<Vec<Vec<f64>>> {
+    let a = py_matrix_to_rows(a)?;
+    let b = py_matrix_to_rows(b)?;
+    let elements = element_count(&a) + element_count(&b);
+    allow_threads_above(py, elements, || tensor_ops::simd_matmul(&a, &b)).map_err(Into::into)
+}
 
-    // Release GIL during computation
-    py.allow_threads(move || tensor_ops::simd_matmul(&a_clone, &b_clone).map_err(Into::into))
+/// Single-precision `simd_matmul`. float32 buffers such as NumPy arrays are
+/// read directly; other inputs are converted to float32 first.
+#[pyfunction]
+fn simd_matmul_f32(
+    py: Python<'_>,
+    a: &Bound<'_, PyAny>,
+    b: &Bound<'_, PyAny>,
+) -> PyResult<Vec<Vec<f32>>> {
+    let (a, rows_a, cols_a) = py_matrix_to_flat_f32(a)?;
+    let (b, rows_b, cols_b) = py_matrix_to_flat_f32(b)?;
+    let out = allow_threads_above(py, a.len() + b.len(), || {
+        tensor_ops::simd_matmul_f32(&a, (rows_a, cols_a), &b, (rows_b, cols_b))
+    })?;
+    Ok(out.chunks_exact(cols_b).map(<[f32]>::to_vec).collect())
 }
 
 #[pyfunction]
@@ -62,55 +122,56 @@ fn transpose(matrix: Vec<Vec<f64>>) -> PyResult<Vec<Vec<f64>>> {
     tensor_ops::transpose(&matrix).map_err(Into::into)
 }
 
+/// Accepts nested lists or 2-D float64/float32 buffers such as NumPy arrays.
 #[pyfunction]
-fn elementwise_add(py: Python<'_>, a: Vec<Vec<f64>>, b: Vec<Vec<f64>>) -> PyResult<Vec<Vec<f64>>> {
-    let a_clone = a.clone();
-    let b_clone = b.clone();
-
-    // Release GIL during computation
-    py.allow_threads(move || tensor_ops::elementwise_add(&a_clone, &b_clone).map_err(Into::into))
+fn elementwise_add(
+    py: Python<'_>,
+    a: &Bound<'_, PyAny>,
+    b: &Bound<'_, PyAny>,
+) -> PyResult<Vec<Vec<f64>>> {
+    let a = py_matrix_to_rows(a)?;
+    let b = py_matrix_to_rows(b)?;
+    let elements = element_count(&a) + element_count(&b);
+    allow_threads_above(py, elements, || tensor_ops::elementwise_add(&a, &b)).map_err(Into::into)
 }
 
+/// Accepts nested lists or 2-D float64/float32 buffers such as NumPy arrays;
+/// buffers skip the per-element list conversion.
 #[pyfunction]
 fn simd_elementwise_add(
     py: Python<'_>,
-    a: Vec<Vec<f64>>,
-    b: Vec<Vec<f64>>,
+    a: &Bound<'_, PyAny>,
+    b: &Bound<'_, PyAny>,
 ) -> PyResult<Vec<Vec<f64>>> {
-    let a_clone = a.clone();
-    let b_clone = b.clone();
-
-    // Release GIL during computation
-    py.allow_threads(move || {
-        tensor_ops::simd_elementwise_add(&a_clone, &b_clone).map_err(Into::into)
-    })
+    let a = py_matrix_to_rows(a)?;
+    let b = py_matrix_to_rows(b)?;
+    let elements = element_count(&a) + element_count(&b);
+    let out = allow_threads_above(py, elements, || tensor_ops::simd_elementwise_add(&a, &b));
+    out.map_err(Into::into)
 }
 
 #[pyfunction]
 fn elementwise_mul(py: Python<'_>, a: Vec<Vec<f64>>, b: Vec<Vec<f64>>) -> PyResult<Vec<Vec<f64>>> {
-    let a_clone = a.clone();
-    let b_clone = b.clone();
-
-    // Release GIL during computation
-    py.allow_threads(move || tensor_ops::hadamard(&a_clone, &b_clone).map_err(Into::into))
+    let elements = element_count(&a) + element_count(&b);
+    allow_threads_above(py, elements, || tensor_ops::hadamard(&a, &b)).map_err(Into::into)
 }
 
 #[pyfunction]
 fn conv2d(py: Python<'_>, a: Vec<Vec<f64>>, k: Vec<Vec<f64>>) -> PyResult<Vec<Vec<f64>>> {
-    let a_clone = a.clone();
-    let k_clone = k.clone();
-
-    // Release GIL during computation
-    py.allow_threads(move || tensor_ops::conv2d(&a_clone, &k_clone).map_err(Into::into))
+    let elements = element_count(&a) + element_count(&k);
+    allow_threads_above(py, elements, || tensor_ops::conv2d(&a, &k)).map_err(Into::into)
 }
 
 #[pyfunction]
 fn max_pool2d(py: Python<'_>, a: Vec<Vec<f64>>, size: usize) -> PyResult<Vec<Vec<f64>>> {
-    let a_clone = a.clone();
-    let size_clone = size;
+    let elements = element_count(&a);
+    allow_threads_above(py, elements, || tensor_ops::max_pool2d(&a, size)).map_err(Into::into)
+}
 
-    // Release GIL during computation
-    py.allow_threads(move || tensor_ops::max_pool2d(&a_clone, size_clone).map_err(Into::into))
+/// Apply a list of `(operation, argument)` specs to one matrix in a single call.
+#[pyfunction]
+fn batch_ops(matrix: Vec<Vec<f64>>, ops: Vec<(String, f64)>) -> PyResult<Vec<Vec<Vec<f64>>>> {
+    tensor_ops::batch_ops(&matrix, &ops).map_err(Into::into)
 }
 
 #[pyfunction]
@@ -118,24 +179,28 @@ fn trigger_panic() -> PyResult<()> {
     Err(ForziumError::Compute("forced panic".into()).into())
 }
 
+/// FFI call-overhead floor: no arguments, no result.
 #[pyfunction]
-fn noop() -> PyResult<()> {
-    Ok(())
-}
+#[pyo3(signature = ())]
+fn noop() {}
 
+/// FFI round-trip floor for a single positional-only integer.
 #[pyfunction]
-fn echo_u64(value: u64) -> PyResult<u64> {
-    Ok(value)
+#[pyo3(signature = (value, /))]
+fn echo_u64(value: u64) -> u64 {
+    value
 }
 
 #[pyfunction]
-fn scale(vector: Vec<f64>, factor: f64) -> PyResult<Vec<f64>> {
-    data_transform::scale(&vector, factor).map_err(Into::into)
+fn scale(py: Python<'_>, vector: Vec<f64>, factor: f64) -> PyResult<Bound<'_, PyList>> {
+    let out = data_transform::scale(&vector, factor)?;
+    PyList::new(py, out.as_slice())
 }
 
 #[pyfunction]
-fn normalize(vector: Vec<f64>) -> PyResult<Vec<f64>> {
-    data_transform::normalize(&vector).map_err(Into::into)
+fn normalize(py: Python<'_>, vector: Vec<f64>) -> PyResult<Bound<'_, PyList>> {
+    let out = data_transform::normalize(&vector)?;
+    PyList::new(py, out.as_slice())
 }
 
 #[pyfunction]
@@ -143,6 +208,31 @@ fn reshape(vector: Vec<f64>, rows: usize, cols: usize) -> PyResult<Vec<Vec<f64>>
     data_transform::reshape(&vector, rows, cols).map_err(Into::into)
 }
 
+/// Like `reshape`, but returns a 2-D float64 memoryview instead of nested
+/// lists, skipping one Python float per element.
+#[pyfunction]
+fn reshape_buffer<'py>(
+    py: Python<'py>,
+    vector: Vec<f64>,
+    rows: usize,
+    cols: usize,
+) -> PyResult<Bound<'py, PyAny>> {
+    data_transform::validate_reshape(&vector, rows, cols)?;
+    flat_to_py_buffer(py, &vector, rows, cols)
+}
+
+/// Like `transpose`, but returns a 2-D float64 memoryview instead of nested
+/// lists; also accepts buffers such as NumPy arrays.
+#[pyfunction]
+fn transpose_buffer<'py>(
+    py: Python<'py>,
+    matrix: &Bound<'py, PyAny>,
+) -> PyResult<Bound<'py, PyAny>> {
+    let matrix = py_matrix_to_flat(matrix)?;
+    let out = tensor_ops::transpose_flat(&matrix)?;
+    flat_to_py_buffer(py, &out.data, out.rows, out.cols)
+}
+
 #[pyfunction]
 fn rayon_pool_metrics(py: Python<'_>, reset: Option<bool>) -> PyResult<PyObject> {
     let snapshot = if reset.unwrap_or(false) {
@@ -152,18 +242,27 @@ fn rayon_pool_metrics(py: Python<'_>, reset: Option<bool>) -> PyResult<PyObject>
         rayon_metrics::snapshot()
     };
     let dict = PyDict::new(py);
-    dict.set_item("observed_threads", snapshot.observed_threads)?;
-    dict.set_item("max_active_threads", snapshot.max_active_threads)?;
-    dict.set_item("mean_active_threads", snapshot.mean_active_threads)?;
-    dict.set_item("utilization_percent", snapshot.utilization_percent)?;
-    dict.set_item("peak_saturation", snapshot.peak_saturation)?;
-    dict.set_item("total_tasks_started", snapshot.total_tasks_started)?;
-    dict.set_item("total_tasks_completed", snapshot.total_tasks_completed)?;
-    dict.set_item("mean_task_duration_us", snapshot.mean_task_duration_us)?;
-    dict.set_item("max_task_duration_us", snapshot.max_task_duration_us)?;
-    dict.set_item("min_task_duration_us", snapshot.min_task_duration_us)?;
-    dict.set_item("busy_time_seconds", snapshot.busy_time_seconds)?;
-    dict.set_item("observation_seconds", snapshot.observation_seconds)?;
+    // Keys are interned: the Python strings are created on the first call and
+    // reused afterwards instead of being rebuilt for every snapshot.
+    macro_rules! set_fields {
+        ($($field:ident),* $(,)?) => {
+            $(dict.set_item(intern!(py, stringify!($field)), snapshot.$field)?;)*
+        };
+    }
+    set_fields!(
+        observed_threads,
+        max_active_threads,
+        mean_active_threads,
+        utilization_percent,
+        peak_saturation,
+        total_tasks_started,
+        total_tasks_completed,
+        mean_task_duration_us,
+        max_task_duration_us,
+        min_task_duration_us,
+        busy_time_seconds,
+        observation_seconds,
+    );
     Ok(dict.into())
 }
 
@@ -269,18 +368,23 @@ fn run_in_io_threadpool(py: Python<'_>, func: &Bound<PyAny>) -> PyResult<PyObjec
 #[pymodule]
 fn forzium_engine(py: Python, m: &Bound<PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(multiply, m)?)?;
+    m.add_function(wrap_pyfunction!(multiply_scalar, m)?)?;
     m.add_function(wrap_pyfunction!(add, m)?)?;
     m.add_function(wrap_pyfunction!(matmul, m)?)?;
     m.add_function(wrap_pyfunction!(simd_matmul, m)?)?;
+    m.add_function(wrap_pyfunction!(simd_matmul_f32, m)?)?;
     m.add_function(wrap_pyfunction!(transpose, m)?)?;
     m.add_function(wrap_pyfunction!(elementwise_add, m)?)?;
     m.add_function(wrap_pyfunction!(simd_elementwise_add, m)?)?;
     m.add_function(wrap_pyfunction!(elementwise_mul, m)?)?;
     m.add_function(wrap_pyfunction!(conv2d, m)?)?;
     m.add_function(wrap_pyfunction!(max_pool2d, m)?)?;
+    m.add_function(wrap_pyfunction!(batch_ops, m)?)?;
     m.add_function(wrap_pyfunction!(scale, m)?)?;
     m.add_function(wrap_pyfunction!(normalize, m)?)?;
     m.add_function(wrap_pyfunction!(reshape, m)?)?;
+    m.add_function(wrap_pyfunction!(reshape_buffer, m)?)?;
+    m.add_function(wrap_pyfunction!(transpose_buffer, m)?)?;
     m.add_function(wrap_pyfunction!(noop, m)?)?;
     m.add_function(wrap_pyfunction!(echo_u64, m)?)?;
     m.add_function(wrap_pyfunction!(force_gc, m)?)?;
@@ -335,11 +439,9 @@ mod tests {
     #[test]
     fn noop_and_echo_functions_round_trip() {
         Python::with_gil(|_py| {
-            noop().expect("noop should succeed");
-            let value = echo_u64(42).expect("echo should return value");
-            assert_eq!(value, 42);
-            let zero = echo_u64(0).expect("echo should accept zero");
-            assert_eq!(zero, 0);
+            noop();
+            assert_eq!(echo_u64(42), 42);
+            assert_eq!(echo_u64(0), 0);
         });
     }
 }
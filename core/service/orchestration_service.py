@@ -66,10 +66,13 @@ except ImportError:  # pragma: no cover
             return result
 
         @staticmethod
-        def force_gc() -> None:
-            import gc
+        def force_gc(include_python: bool = False) -> int:
+            # No engine scratch buffers exist without the extension.
+            if include_python:
+                import gc
 
-            gc.collect()
+                gc.collect()
+            return 0
 
     forzium_engine = _PyOps()  # type: ignore[assignment]
 
@@ -17,12 +17,16 @@ class ComputeRequest:
         self.operation = validated["operation"]
         self.parameters = validated["parameters"]
 
-    def dict(self) -> dict[str, Any]:
+    def model_dump(self) -> dict[str, Any]:
         return {
             "data": self.data,
             "operation": self.operation,
             "parameters": self.parameters,
         }
 
-    def json(self) -> str:
-        return json.dumps(self.dict())
+    def model_dump_json(self) -> str:
+        return json.dumps(self.model_dump())
+
+    # Pydantic v1-style aliases kept for existing callers.
+    dict = model_dump
+    json = model_dump_json
@@ -147,8 +147,7 @@ class StreamingResponse(Response):
     def body_iter(self) -> Iterable[bytes]:
         """Yield response body chunks."""
 
-        for chunk in self._content:
-            yield chunk
+        yield from self._content
 
     def serialize(self) -> tuple[int, bytes, dict[str, str]]:
         """Serialization is unsupported for streaming responses."""
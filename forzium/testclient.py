@@ -33,6 +33,40 @@ class TestClient:
     
     def __init__(self, app: ForziumApp) -> None:
         self.app = app
+        self._handlers: dict[int, tuple[dict[str, Any], tuple[Any, ...], Any]] = {}
+
+    def _handler_for(self, route: dict[str, Any]) -> Any:
+        """Return the compiled handler for ``route``, building it once.
+
+        Handlers are rebuilt only when the override mappings or the ASGI
+        middleware stack they were built against have been replaced.
+        """
+        route_app = route.get("app", self.app)
+        overrides = [route.get("dependency_overrides", {})]
+        if route.get("use_parent_overrides", True):
+            overrides.append(self.app.dependency_overrides)
+        signature = (
+            tuple(id(o) for o in overrides),
+            tuple(route_app._asgi_middleware),  # pylint: disable=protected-access
+        )
+        cached = self._handlers.get(id(route))
+        if cached is not None and cached[0] is route and cached[1] == signature:
+            return cached[2]
+        handler = route_app._make_handler(  # pylint: disable=protected-access
+            route["func"],
+            route["param_names"],
+            route["param_converters"],
+            route["query_params"],
+            route.get("body_param"),
+            route["dependencies"],
+            route.get("expects_request", False),
+            route["method"],
+            route["path"],
+            route.get("background_param"),
+            overrides,
+        )
+        self._handlers[id(route)] = (route, signature, handler)
+        return handler
 
     def request(
         self,
@@ -86,23 +120,7 @@ class TestClient:
                 break
         if route is None:
             raise ValueError(f"no route for {method} {path}")
-        route_app = route.get("app", self.app)
-        overrides = [route.get("dependency_overrides", {})]
-        if route.get("use_parent_overrides", True):
-            overrides.append(self.app.dependency_overrides)
-        handler = route_app._make_handler(  # pylint: disable=protected-access
-            route["func"],
-            route["param_names"],
-            route["param_converters"],
-            route["query_params"],
-            route.get("body_param"),
-            route["dependencies"],
-            route.get("expects_request", False),
-            route["method"],
-            route["path"],
-            route.get("background_param"),
-            overrides,
-        )
+        handler = self._handler_for(route)
         if body is not None and json_body is not None:
             raise ValueError("provide either json_body or body")
         body_bytes = (
@@ -178,7 +178,9 @@ class _ObservabilityGate:
     def wait(self, timeout: float | None = None) -> bool:
         """Block until the gate is opened or *timeout* elapses."""
 
-        return self._event.wait(timeout)
+        # ``is_set`` is a plain flag read; only fall through to the
+        # lock-acquiring wait while the gate is still closed.
+        return self._event.is_set() or self._event.wait(timeout)
 
     def reset(self) -> None:
         """Return the gate to its initial state."""
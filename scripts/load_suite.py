@@ -7,7 +7,7 @@ import math
 import random
 from dataclasses import dataclass, field
 from pathlib import Path
-from statistics import mean
+from statistics import fmean
 from typing import Any, Iterable, Mapping, MutableMapping, Sequence
 
 
@@ -534,7 +534,7 @@ class LoadSuiteRunner:
                 latencies = info.pop("latencies", [])
                 included = info.get("included_requests", 0)
                 info["latency_ms"] = {
-                    "mean": mean(latencies) if latencies else 0.0,
+                    "mean": fmean(latencies) if latencies else 0.0,
                     "p95": self._percentile(latencies, 95.0),
                 }
                 fail_rate = info.get("failure_rate")
@@ -562,7 +562,7 @@ class LoadSuiteRunner:
                 "plan_duration_s": plan.total_duration_s,
                 "metrics": {
                     "latency_ms": {
-                        "mean": mean(latency_samples) if latency_samples else 0.0,
+                        "mean": fmean(latency_samples) if latency_samples else 0.0,
                         "p95": self._percentile(latency_samples, 95.0),
                     }
                 },
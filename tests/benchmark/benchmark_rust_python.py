@@ -50,7 +50,7 @@ def benchmark_matrix_multiply(size: int, runs: int = 5) -> BenchmarkResult:
     
     Args:
         size: Size of the square matrix to test
-        runs: Number of runs to average
+        runs: Number of repeats; the fastest run is reported
         
     Returns:
         Dictionary with benchmark results
@@ -103,23 +103,23 @@ def benchmark_matrix_multiply(size: int, runs: int = 5) -> BenchmarkResult:
         matrix_np_copy = matrix.copy()
         zero_copy_times.append(time_execution(zero_copy_multiply_bench, matrix_np_copy, factor))
     
-    # Calculate averages
-    avg_py = sum(py_times) / runs
-    avg_rust = sum(rust_times) / runs
-    avg_numpy = sum(numpy_times) / runs
-    avg_zero_copy = sum(zero_copy_times) / runs
+    # Report the fastest run; slower repeats only add scheduler/GC noise
+    best_py = min(py_times)
+    best_rust = min(rust_times)
+    best_numpy = min(numpy_times)
+    best_zero_copy = min(zero_copy_times)
     
     # Calculate speedups
-    rust_speedup = avg_py / avg_rust if avg_rust > 0 else 0
-    numpy_speedup = avg_py / avg_numpy if avg_numpy > 0 else 0
-    zero_copy_speedup = avg_py / avg_zero_copy if avg_zero_copy > 0 else 0
+    rust_speedup = best_py / best_rust if best_rust > 0 else 0
+    numpy_speedup = best_py / best_numpy if best_numpy > 0 else 0
+    zero_copy_speedup = best_py / best_zero_copy if best_zero_copy > 0 else 0
     
     return {
         "name": "matrix_multiply",
-        "python_time": avg_py,
-        "rust_time": avg_rust,
-        "numpy_time": avg_numpy,
-        "zero_copy_time": avg_zero_copy,
+        "python_time": best_py,
+        "rust_time": best_rust,
+        "numpy_time": best_numpy,
+        "zero_copy_time": best_zero_copy,
         "rust_speedup": rust_speedup,
         "numpy_speedup": numpy_speedup,
         "zero_copy_speedup": zero_copy_speedup,
@@ -136,7 +136,7 @@ def benchmark_convolution(size: int, kernel_size: int = 3, runs: int = 5) -> Ben
     Args:
         size: Size of the square input matrix
         kernel_size: Size of the square convolution kernel
-        runs: Number of runs to average
+        runs: Number of repeats; the fastest run is reported
         
     Returns:
         Dictionary with benchmark results
@@ -198,23 +198,23 @@ def benchmark_convolution(size: int, kernel_size: int = 3, runs: int = 5) -> Ben
             
         zero_copy_times.append(time_execution(zero_copy_convolve, image, kernel))
     
-    # Calculate averages
-    avg_py = sum(py_times) / runs
-    avg_rust = sum(rust_times) / runs
-    avg_numpy = sum(numpy_times) / runs if numpy_times[0] > 0 else 0
-    avg_zero_copy = sum(zero_copy_times) / runs
+    # Report the fastest run; slower repeats only add scheduler/GC noise
+    best_py = min(py_times)
+    best_rust = min(rust_times)
+    best_numpy = min(numpy_times) if numpy_times[0] > 0 else 0
+    best_zero_copy = min(zero_copy_times)
     
     # Calculate speedups
-    rust_speedup = avg_py / avg_rust if avg_rust > 0 else 0
-    numpy_speedup = avg_py / avg_numpy if avg_numpy > 0 else 0
-    zero_copy_speedup = avg_py / avg_zero_copy if avg_zero_copy > 0 else 0
+    rust_speedup = best_py / best_rust if best_rust > 0 else 0
+    numpy_speedup = best_py / best_numpy if best_numpy > 0 else 0
+    zero_copy_speedup = best_py / best_zero_copy if best_zero_copy > 0 else 0
     
     return {
         "name": "convolution",
-        "python_time": avg_py,
-        "rust_time": avg_rust,
-        "numpy_time": avg_numpy,
-        "zero_copy_time": avg_zero_copy,
+        "python_time": best_py,
+        "rust_time": best_rust,
+        "numpy_time": best_numpy,
+        "zero_copy_time": best_zero_copy,
         "rust_speedup": rust_speedup,
         "numpy_speedup": numpy_speedup,
         "zero_copy_speedup": zero_copy_speedup,
@@ -230,7 +230,7 @@ def benchmark_matrix_operations_parallel(size: int, runs: int = 3) -> BenchmarkR
     
     Args:
         size: Size of the square matrix
-        runs: Number of runs to average
+        runs: Number of repeats; the fastest run is reported
         
     Returns:
         Dictionary with benchmark results
@@ -275,21 +275,21 @@ def benchmark_matrix_operations_parallel(size: int, runs: int = 3) -> BenchmarkR
         py_times.append(time_execution(py_parallel_matmul, matrix_a, matrix_b))
         rust_times.append(time_execution(rust_matmul, matrix_a, matrix_b))
     
-    # Calculate averages
-    avg_py = sum(py_times) / runs
-    avg_rust = sum(rust_times) / runs
+    # Report the fastest run; slower repeats only add scheduler/GC noise
+    best_py = min(py_times)
+    best_rust = min(rust_times)
     
     # Get thread pool metrics
     metrics = forzium_engine.rayon_pool_metrics()
     threads_used = metrics["observed_threads"]
     
     # Calculate speedup
-    speedup = avg_py / avg_rust if avg_rust > 0 else 0
+    speedup = best_py / best_rust if best_rust > 0 else 0
     
     return {
         "name": "parallel_matmul",
-        "python_time": avg_py,
-        "rust_time": avg_rust,
+        "python_time": best_py,
+        "rust_time": best_rust,
         "speedup": speedup,
         "size": size,
         "threads": threads_used,
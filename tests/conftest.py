@@ -7,17 +7,32 @@ for all test modules across the test suite.
 
 import gc
 import os
+import shutil
 import sys
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, Generator, List
+from typing import Any, Callable, Dict, Generator, List, Tuple
 
 import pytest
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
+# Add project root to path; resolved once and reused by fixtures and hooks.
+project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
+# Import the engine once for the whole suite; test modules share this instance.
+try:
+    import forzium_engine as _forzium_engine
+except ImportError:
+    _forzium_engine = None
+
+RUST_ENGINE_AVAILABLE = _forzium_engine is not None and hasattr(
+    _forzium_engine, "multiply"
+)
+
+# FFI boundary modules import the compiled engine unconditionally and would
+# error during collection without it.
+collect_ignore_glob = [] if RUST_ENGINE_AVAILABLE else ["unit/test_ffi_*.py"]
+
 
 # ============================================================================
 # Session-level fixtures
@@ -26,7 +41,15 @@ sys.path.insert(0, str(project_root))
 @pytest.fixture(scope="session")
 def project_root_dir() -> Path:
     """Return the project root directory."""
-    return Path(__file__).parent.parent
+    return project_root
+
+
+@pytest.fixture(scope="session")
+def fe():
+    """Provide the compiled ``forzium_engine`` module, skipping when absent."""
+    if not RUST_ENGINE_AVAILABLE:
+        pytest.skip("Rust engine not available")
+    return _forzium_engine
 
 
 @pytest.fixture(scope="session")
@@ -44,6 +67,41 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
+@pytest.fixture(scope="session")
+def large_float_matrix() -> Callable[..., List[List[float]]]:
+    """
+    Provide a cached builder for large square test matrices.
+
+    Matrices are generated with NumPy broadcasting and converted with a
+    single ``tolist()`` call instead of nested Python comprehensions, then
+    shared for the whole session. Callers must treat them as read-only.
+
+    Patterns:
+        ``"sum"``: ``m[i][j] = i + j``
+        ``"product"``: ``m[i][j] = i * j``
+        ``"ones"``: every element is ``1.0``
+    """
+    np = pytest.importorskip("numpy")
+    cache: Dict[Tuple[int, str], List[List[float]]] = {}
+
+    def build(size: int, pattern: str = "sum") -> List[List[float]]:
+        key = (size, pattern)
+        if key not in cache:
+            idx = np.arange(size, dtype=np.float64)
+            if pattern == "sum":
+                arr = idx[:, None] + idx
+            elif pattern == "product":
+                arr = np.outer(idx, idx)
+            elif pattern == "ones":
+                arr = np.ones((size, size))
+            else:
+                raise ValueError(f"Unknown matrix pattern: {pattern}")
+            cache[key] = arr.tolist()
+        return cache[key]
+
+    return build
+
+
 # ============================================================================
 # Module-level fixtures
 # ============================================================================
@@ -51,11 +109,7 @@ def temp_dir() -> Generator[Path, None, None]:
 @pytest.fixture(scope="module")
 def rust_engine_available() -> bool:
     """Check if Rust engine is available."""
-    try:
-        import forzium_engine
-        return hasattr(forzium_engine, "multiply")
-    except ImportError:
-        return False
+    return RUST_ENGINE_AVAILABLE
 
 
 # ============================================================================
@@ -70,9 +124,9 @@ def cleanup_gc():
     gc.collect()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def small_matrix() -> List[List[float]]:
-    """Provide a small 2x2 test matrix."""
+    """Provide a small 2x2 test matrix (session-shared; do not mutate)."""
     return [[1.0, 2.0], [3.0, 4.0]]
 
 
@@ -104,21 +158,21 @@ def zero_matrix() -> List[List[float]]:
     return [[0.0, 0.0, 0.0] for _ in range(3)]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ragged_matrix() -> List[List[float]]:
-    """Provide a ragged (invalid) matrix for error testing."""
+    """Provide a ragged (invalid) matrix for error testing (session-shared)."""
     return [[1.0, 2.0], [3.0, 4.0, 5.0], [6.0]]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_matrix() -> List[List[float]]:
-    """Provide an empty matrix for error testing."""
+    """Provide an empty matrix for error testing (session-shared)."""
     return []
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_row_matrix() -> List[List[float]]:
-    """Provide a matrix with empty rows for error testing."""
+    """Provide a matrix with empty rows for error testing (session-shared)."""
     return [[]]
 
 
@@ -128,15 +182,19 @@ def vector_1d() -> List[float]:
     return [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def vector_zeros() -> List[float]:
-    """Provide a zero vector for normalization edge cases."""
+    """Provide a zero vector for normalization edge cases (session-shared)."""
     return [0.0, 0.0, 0.0, 0.0]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def compute_engine():
-    """Provide a ComputeEngine instance."""
+    """Provide a ComputeEngine instance shared by every test in a module.
+
+    The engine holds no per-call state, so constructing it once per module
+    avoids repeating the binding setup in each test.
+    """
     try:
         from forzium_engine import ComputeEngine
         return ComputeEngine()
@@ -144,9 +202,9 @@ def compute_engine():
         pytest.skip("Rust engine not available")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def compute_request_schema():
-    """Provide a ComputeRequestSchema instance."""
+    """Provide a ComputeRequestSchema instance shared within a module."""
     try:
         from forzium_engine import ComputeRequestSchema
         return ComputeRequestSchema()
@@ -164,6 +222,14 @@ def pool_allocator():
         pytest.skip("Rust engine not available")
 
 
+@pytest.fixture
+def verbose_errors(fe):
+    """Enable verbose engine errors for one test, then restore the prior mode."""
+    previous = fe.set_verbose_errors(True)
+    yield
+    fe.set_verbose_errors(previous)
+
+
 @pytest.fixture
 def sample_compute_request() -> Dict[str, Any]:
     """Provide a valid compute request payload."""
@@ -268,23 +334,17 @@ def assert_matrices_equal(
 ) -> None:
     """
     Assert that two matrices are equal within tolerance.
-    
+
+    Both sides are compared as float64 arrays in one vectorised pass;
+    buffers such as memoryviews are accepted alongside nested lists.
+
     Args:
         a: First matrix
         b: Second matrix
         rtol: Relative tolerance
         atol: Absolute tolerance
     """
-    assert len(a) == len(b), f"Row count mismatch: {len(a)} != {len(b)}"
-    for i, (row_a, row_b) in enumerate(zip(a, b)):
-        assert len(row_a) == len(row_b), f"Column count mismatch at row {i}"
-        for j, (val_a, val_b) in enumerate(zip(row_a, row_b)):
-            diff = abs(val_a - val_b)
-            threshold = atol + rtol * abs(val_b)
-            assert diff <= threshold, (
-                f"Value mismatch at [{i}][{j}]: "
-                f"{val_a} != {val_b} (diff={diff}, threshold={threshold})"
-            )
+    _assert_arrays_close(a, b, rtol, atol)
 
 
 def assert_vectors_equal(
@@ -295,21 +355,29 @@ def assert_vectors_equal(
 ) -> None:
     """
     Assert that two vectors are equal within tolerance.
-    
+
     Args:
         a: First vector
         b: Second vector
         rtol: Relative tolerance
         atol: Absolute tolerance
     """
-    assert len(a) == len(b), f"Length mismatch: {len(a)} != {len(b)}"
-    for i, (val_a, val_b) in enumerate(zip(a, b)):
-        diff = abs(val_a - val_b)
-        threshold = atol + rtol * abs(val_b)
-        assert diff <= threshold, (
-            f"Value mismatch at [{i}]: "
-            f"{val_a} != {val_b} (diff={diff}, threshold={threshold})"
-        )
+    _assert_arrays_close(a, b, rtol, atol)
+
+
+def _assert_arrays_close(a: Any, b: Any, rtol: float, atol: float) -> None:
+    """Check ``|a - b| <= atol + rtol * |b|`` element-wise, shapes included."""
+    # Imported here so collecting the suite does not require numpy.
+    import numpy as np
+
+    actual = np.asarray(a, dtype=np.float64)
+    expected = np.asarray(b, dtype=np.float64)
+    assert actual.shape == expected.shape, (
+        f"Shape mismatch: {actual.shape} != {expected.shape}"
+    )
+    np.testing.assert_allclose(
+        actual, expected, rtol=rtol, atol=atol, equal_nan=False
+    )
 
 
 # Export utilities for use in test modules
@@ -321,12 +389,53 @@ pytest.assert_vectors_equal = assert_vectors_equal
 # Hooks
 # ============================================================================
 
+# Kernel-class keywords used to auto-tag tests by the engine functions they name
+COMPUTE_BOUND_KEYWORDS = ("matmul", "conv2d")
+MEMORY_BOUND_KEYWORDS = (
+    "multiply",
+    "add",
+    "transpose",
+    "elementwise",
+    "max_pool",
+    "scale",
+    "normalize",
+    "reshape",
+)
+
+
+def pytest_addoption(parser):
+    """Register command-line options for the test suite."""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+    parser.addoption(
+        "--shm-tmp",
+        action="store_true",
+        default=False,
+        help="keep tmp_path directories under /dev/shm for this run",
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom settings."""
     # Create logs directory if it doesn't exist
-    log_dir = Path(__file__).parent / "logs"
+    log_dir = project_root / "tests" / "logs"
     log_dir.mkdir(exist_ok=True)
 
+    # Opt-in (--shm-tmp): keep tmp_path/tmp_path_factory on a RAM-backed
+    # filesystem. Each run gets its own fresh directory, removed at exit, and
+    # an explicit --basetemp still wins.
+    if (
+        config.getoption("--shm-tmp")
+        and config.option.basetemp is None
+        and os.path.isdir("/dev/shm")
+    ):
+        basetemp = tempfile.mkdtemp(prefix="forzium-pytest-", dir="/dev/shm")
+        config.option.basetemp = basetemp
+        config.add_cleanup(lambda: shutil.rmtree(basetemp, ignore_errors=True))
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test names."""
@@ -347,3 +456,17 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(pytest.mark.memory)
         if "error" in item.name or "invalid" in item.name:
             item.add_marker(pytest.mark.error_handling)
+
+        # Auto-mark kernel class for perf jobs; error-path tests never reach the kernels
+        if item.get_closest_marker("error_handling") is None:
+            if any(key in item.name for key in COMPUTE_BOUND_KEYWORDS):
+                item.add_marker(pytest.mark.compute_bound)
+            elif any(key in item.name for key in MEMORY_BOUND_KEYWORDS):
+                item.add_marker(pytest.mark.memory_bound)
+
+    # Slow tests only run on request (e.g. nightly jobs)
+    if not config.getoption("--runslow"):
+        skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+        for item in items:
+            if "slow" in item.keywords:
+                item.add_marker(skip_slow)
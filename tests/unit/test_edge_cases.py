@@ -5,15 +5,108 @@ Tests boundary conditions, invalid inputs, and error handling
 across all Rust functions exposed to Python.
 """
 
+from math import inf, isnan, nan, sqrt
+
 import pytest
 import sys
 
-try:
-    import forzium_engine
-    RUST_AVAILABLE = True
-except ImportError:
-    RUST_AVAILABLE = False
-    pytestmark = pytest.mark.skip(reason="Rust engine not available")
+import forzium_engine
+
+# conftest decides once whether the compiled engine is present; its ``fe``
+# fixture skips every test here when only the Python fallback is installed.
+pytestmark = pytest.mark.usefixtures("fe")
+
+
+# Shared invalid inputs; the engine only reads them, so every case can reuse one instance.
+_EMPTY = []
+_EMPTY_ROW = [[]]
+_RAGGED = [[1.0, 2.0], [3.0, 4.0, 5.0], [6.0]]
+_SMALL = [[1.0, 2.0], [3.0, 4.0]]
+_SQUARE_3X3 = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]
+_NAN_ROW = [[1.0, nan]]
+
+# Each case is (function name, positional args, accepted message keywords or None).
+MATRIX_VALIDATION_CASES = [
+    pytest.param("multiply", (_EMPTY, 2.0), ("empty", "validation"), id="multiply_empty_matrix"),
+    pytest.param("multiply", (_EMPTY_ROW, 2.0), ("empty", "validation"), id="multiply_empty_row"),
+    pytest.param("multiply", (_RAGGED, 2.0), ("ragged", "validation"), id="multiply_ragged_matrix"),
+    pytest.param("add", (_EMPTY, 10.0), None, id="add_empty_matrix"),
+    pytest.param("add", (_RAGGED, 10.0), None, id="add_ragged_matrix"),
+    pytest.param("transpose", (_EMPTY,), None, id="transpose_empty_matrix"),
+    pytest.param("transpose", (_EMPTY_ROW,), None, id="transpose_empty_row"),
+]
+
+MATMUL_ERROR_CASES = [
+    pytest.param(
+        "matmul", ([[1.0, 2.0]], [[1.0], [2.0], [3.0]]), ("shape", "mismatch"),
+        id="matmul_shape_mismatch",
+    ),
+    pytest.param("matmul", (_EMPTY, _SMALL), None, id="matmul_empty_first_matrix"),
+    pytest.param("matmul", (_SMALL, _EMPTY), None, id="matmul_empty_second_matrix"),
+    pytest.param("matmul", (_RAGGED, _SMALL), None, id="matmul_ragged_first_matrix"),
+    pytest.param("matmul", (_SMALL, _RAGGED), None, id="matmul_ragged_second_matrix"),
+    pytest.param(
+        "simd_matmul", ([[1.0, 2.0, 3.0]], [[1.0], [2.0]]), None,
+        id="simd_matmul_shape_mismatch",
+    ),
+    pytest.param("simd_matmul", (_EMPTY, [[1.0]]), None, id="simd_matmul_empty_matrix"),
+]
+
+ELEMENTWISE_ERROR_CASES = [
+    pytest.param(
+        "elementwise_add", (_SMALL, [[1.0, 2.0, 3.0]]), ("shape", "mismatch"),
+        id="elementwise_add_shape_mismatch",
+    ),
+    pytest.param(
+        "elementwise_add", ([[1.0, 2.0]], _SMALL), None, id="elementwise_add_different_rows",
+    ),
+    pytest.param(
+        "elementwise_add", (_SMALL, [[1.0], [2.0]]), None, id="elementwise_add_different_cols",
+    ),
+    pytest.param(
+        "simd_elementwise_add", ([[1.0, 2.0]], [[1.0]]), None,
+        id="simd_elementwise_add_shape_mismatch",
+    ),
+    pytest.param(
+        "elementwise_mul", ([[1.0, 2.0]], _SMALL), None, id="elementwise_mul_shape_mismatch",
+    ),
+]
+
+CONVOLUTION_ERROR_CASES = [
+    pytest.param(
+        "conv2d", (_SMALL, _SQUARE_3X3), ("kernel", "larger"), id="conv2d_kernel_too_large",
+    ),
+    pytest.param("conv2d", (_EMPTY, [[1.0]]), None, id="conv2d_empty_input"),
+    pytest.param("conv2d", (_SMALL, _EMPTY), None, id="conv2d_empty_kernel"),
+    pytest.param("conv2d", (_RAGGED, [[1.0]]), None, id="conv2d_ragged_input"),
+    pytest.param("max_pool2d", (_SMALL, 0), ("pool", "invalid"), id="max_pool2d_size_zero"),
+    pytest.param("max_pool2d", (_SQUARE_3X3, 2), None, id="max_pool2d_size_not_divisor"),
+    pytest.param("max_pool2d", (_EMPTY, 2), None, id="max_pool2d_empty_matrix"),
+]
+
+DATA_TRANSFORM_ERROR_CASES = [
+    pytest.param("scale", (_EMPTY, 2.0), None, id="scale_empty_vector"),
+    pytest.param("normalize", (_EMPTY,), None, id="normalize_empty_vector"),
+    pytest.param(
+        "reshape", ([1.0, 2.0, 3.0, 4.0, 5.0], 2, 3), None, id="reshape_size_mismatch",
+    ),
+    pytest.param("reshape", (_EMPTY, 2, 2), None, id="reshape_empty_vector"),
+    pytest.param("reshape", ([1.0, 2.0, 3.0, 4.0], 0, 4), None, id="reshape_zero_rows"),
+    pytest.param("reshape", ([1.0, 2.0, 3.0, 4.0], 4, 0), None, id="reshape_zero_cols"),
+]
+
+
+def _assert_engine_error(fn_name, args, keywords):
+    """Call ``forzium_engine.<fn_name>(*args)`` and check that it raises.
+
+    When ``keywords`` is given, the lowered error message must contain at
+    least one of them.
+    """
+    with pytest.raises(Exception) as exc_info:
+        getattr(forzium_engine, fn_name)(*args)
+    if keywords:
+        message = str(exc_info.value).lower()
+        assert any(keyword in message for keyword in keywords), message
 
 
 @pytest.mark.edge_case
@@ -21,43 +114,10 @@ except ImportError:
 class TestMatrixValidationErrors:
     """Test matrix validation error conditions."""
 
-    def test_multiply_empty_matrix(self, empty_matrix):
-        """Test multiply with empty matrix raises error."""
-        with pytest.raises(Exception) as exc_info:
-            forzium_engine.multiply(empty_matrix, 2.0)
-        assert "empty" in str(exc_info.value).lower() or "validation" in str(exc_info.value).lower()
-
-    def test_multiply_empty_row(self, empty_row_matrix):
-        """Test multiply with empty row raises error."""
-        with pytest.raises(Exception) as exc_info:
-            forzium_engine.multiply(empty_row_matrix, 2.0)
-        assert "empty" in str(exc_info.value).lower() or "validation" in str(exc_info.value).lower()
-
-    def test_multiply_ragged_matrix(self, ragged_matrix):
-        """Test multiply with ragged matrix raises error."""
-        with pytest.raises(Exception) as exc_info:
-            forzium_engine.multiply(ragged_matrix, 2.0)
-        assert "ragged" in str(exc_info.value).lower() or "validation" in str(exc_info.value).lower()
-
-    def test_add_empty_matrix(self, empty_matrix):
-        """Test add with empty matrix raises error."""
-        with pytest.raises(Exception):
-            forzium_engine.add(empty_matrix, 10.0)
-
-    def test_add_ragged_matrix(self, ragged_matrix):
-        """Test add with ragged matrix raises error."""
-        with pytest.raises(Exception):
-            forzium_engine.add(ragged_matrix, 10.0)
-
-    def test_transpose_empty_matrix(self, empty_matrix):
-        """Test transpose with empty matrix raises error."""
-        with pytest.raises(Exception):
-            forzium_engine.transpose(empty_matrix)
-
-    def test_transpose_empty_row(self, empty_row_matrix):
-        """Test transpose with empty row raises error."""
-        with pytest.raises(Exception):
-            forzium_engine.transpose(empty_row_matrix)
+    @pytest.mark.parametrize("fn_name,args,keywords", MATRIX_VALIDATION_CASES)
+    def test_invalid_matrix(self, fn_name, args, keywords):
+        """Test empty and ragged matrices raise errors."""
+        _assert_engine_error(fn_name, args, keywords)
 
 
 @pytest.mark.edge_case
@@ -65,45 +125,10 @@ class TestMatrixValidationErrors:
 class TestMatmulErrors:
     """Test matrix multiplication error conditions."""
 
-    def test_matmul_shape_mismatch(self):
-        """Test matmul with incompatible shapes."""
-        a = [[1.0, 2.0]]  # 1x2
-        b = [[1.0], [2.0], [3.0]]  # 3x1
-        with pytest.raises(Exception) as exc_info:
-            forzium_engine.matmul(a, b)
-        assert "shape" in str(exc_info.value).lower() or "mismatch" in str(exc_info.value).lower()
-
-    def test_matmul_empty_first_matrix(self, small_matrix):
-        """Test matmul with empty first matrix."""
-        with pytest.raises(Exception):
-            forzium_engine.matmul([], small_matrix)
-
-    def test_matmul_empty_second_matrix(self, small_matrix):
-        """Test matmul with empty second matrix."""
-        with pytest.raises(Exception):
-            forzium_engine.matmul(small_matrix, [])
-
-    def test_matmul_ragged_first_matrix(self, ragged_matrix, small_matrix):
-        """Test matmul with ragged first matrix."""
-        with pytest.raises(Exception):
-            forzium_engine.matmul(ragged_matrix, small_matrix)
-
-    def test_matmul_ragged_second_matrix(self, small_matrix, ragged_matrix):
-        """Test matmul with ragged second matrix."""
-        with pytest.raises(Exception):
-            forzium_engine.matmul(small_matrix, ragged_matrix)
-
-    def test_simd_matmul_shape_mismatch(self):
-        """Test SIMD matmul with incompatible shapes."""
-        a = [[1.0, 2.0, 3.0]]
-        b = [[1.0], [2.0]]
-        with pytest.raises(Exception):
-            forzium_engine.simd_matmul(a, b)
-
-    def test_simd_matmul_empty_matrix(self):
-        """Test SIMD matmul with empty matrix."""
-        with pytest.raises(Exception):
-            forzium_engine.simd_matmul([], [[1.0]])
+    @pytest.mark.parametrize("fn_name,args,keywords", MATMUL_ERROR_CASES)
+    def test_matmul_error(self, fn_name, args, keywords):
+        """Test incompatible or invalid matmul operands raise errors."""
+        _assert_engine_error(fn_name, args, keywords)
 
 
 @pytest.mark.edge_case
@@ -111,41 +136,10 @@ class TestMatmulErrors:
 class TestElementwiseErrors:
     """Test elementwise operation error conditions."""
 
-    def test_elementwise_add_shape_mismatch(self):
-        """Test elementwise_add with different shapes."""
-        a = [[1.0, 2.0], [3.0, 4.0]]  # 2x2
-        b = [[1.0, 2.0, 3.0]]  # 1x3
-        with pytest.raises(Exception) as exc_info:
-            forzium_engine.elementwise_add(a, b)
-        assert "shape" in str(exc_info.value).lower() or "mismatch" in str(exc_info.value).lower()
-
-    def test_elementwise_add_different_rows(self):
-        """Test elementwise_add with different row counts."""
-        a = [[1.0, 2.0]]
-        b = [[1.0, 2.0], [3.0, 4.0]]
-        with pytest.raises(Exception):
-            forzium_engine.elementwise_add(a, b)
-
-    def test_elementwise_add_different_cols(self):
-        """Test elementwise_add with different column counts."""
-        a = [[1.0, 2.0], [3.0, 4.0]]
-        b = [[1.0], [2.0]]
-        with pytest.raises(Exception):
-            forzium_engine.elementwise_add(a, b)
-
-    def test_simd_elementwise_add_shape_mismatch(self):
-        """Test SIMD elementwise_add with shape mismatch."""
-        a = [[1.0, 2.0]]
-        b = [[1.0]]
-        with pytest.raises(Exception):
-            forzium_engine.simd_elementwise_add(a, b)
-
-    def test_elementwise_mul_shape_mismatch(self):
-        """Test elementwise_mul with different shapes."""
-        a = [[1.0, 2.0]]
-        b = [[1.0, 2.0], [3.0, 4.0]]
-        with pytest.raises(Exception):
-            forzium_engine.elementwise_mul(a, b)
+    @pytest.mark.parametrize("fn_name,args,keywords", ELEMENTWISE_ERROR_CASES)
+    def test_elementwise_error(self, fn_name, args, keywords):
+        """Test mismatched elementwise operands raise errors."""
+        _assert_engine_error(fn_name, args, keywords)
 
 
 @pytest.mark.edge_case
@@ -153,49 +147,10 @@ class TestElementwiseErrors:
 class TestConvolutionErrors:
     """Test convolution and pooling error conditions."""
 
-    def test_conv2d_kernel_too_large(self):
-        """Test conv2d when kernel is larger than input."""
-        input_matrix = [[1.0, 2.0], [3.0, 4.0]]  # 2x2
-        kernel = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]  # 3x3
-        with pytest.raises(Exception) as exc_info:
-            forzium_engine.conv2d(input_matrix, kernel)
-        assert "kernel" in str(exc_info.value).lower() or "larger" in str(exc_info.value).lower()
-
-    def test_conv2d_empty_input(self):
-        """Test conv2d with empty input."""
-        kernel = [[1.0]]
-        with pytest.raises(Exception):
-            forzium_engine.conv2d([], kernel)
-
-    def test_conv2d_empty_kernel(self):
-        """Test conv2d with empty kernel."""
-        input_matrix = [[1.0, 2.0], [3.0, 4.0]]
-        with pytest.raises(Exception):
-            forzium_engine.conv2d(input_matrix, [])
-
-    def test_conv2d_ragged_input(self, ragged_matrix):
-        """Test conv2d with ragged input."""
-        kernel = [[1.0]]
-        with pytest.raises(Exception):
-            forzium_engine.conv2d(ragged_matrix, kernel)
-
-    def test_max_pool2d_size_zero(self):
-        """Test max_pool2d with size 0."""
-        input_matrix = [[1.0, 2.0], [3.0, 4.0]]
-        with pytest.raises(Exception) as exc_info:
-            forzium_engine.max_pool2d(input_matrix, 0)
-        assert "pool" in str(exc_info.value).lower() or "invalid" in str(exc_info.value).lower()
-
-    def test_max_pool2d_size_not_divisor(self):
-        """Test max_pool2d when size doesn't divide dimensions."""
-        input_matrix = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]  # 3x3
-        with pytest.raises(Exception):
-            forzium_engine.max_pool2d(input_matrix, 2)  # 2 doesn't divide 3
-
-    def test_max_pool2d_empty_matrix(self):
-        """Test max_pool2d with empty matrix."""
-        with pytest.raises(Exception):
-            forzium_engine.max_pool2d([], 2)
+    @pytest.mark.parametrize("fn_name,args,keywords", CONVOLUTION_ERROR_CASES)
+    def test_convolution_error(self, fn_name, args, keywords):
+        """Test invalid convolution and pooling inputs raise errors."""
+        _assert_engine_error(fn_name, args, keywords)
 
 
 @pytest.mark.edge_case
@@ -203,15 +158,10 @@ class TestConvolutionErrors:
 class TestDataTransformErrors:
     """Test data transformation error conditions."""
 
-    def test_scale_empty_vector(self):
-        """Test scale with empty vector."""
-        with pytest.raises(Exception):
-            forzium_engine.scale([], 2.0)
-
-    def test_normalize_empty_vector(self):
-        """Test normalize with empty vector."""
-        with pytest.raises(Exception):
-            forzium_engine.normalize([])
+    @pytest.mark.parametrize("fn_name,args,keywords", DATA_TRANSFORM_ERROR_CASES)
+    def test_data_transform_error(self, fn_name, args, keywords):
+        """Test invalid vectors and shapes raise errors."""
+        _assert_engine_error(fn_name, args, keywords)
 
     def test_normalize_zero_vector(self, vector_zeros):
         """Test normalize with all-zero vector."""
@@ -226,25 +176,6 @@ class TestDataTransformErrors:
             # Expected behavior - can't normalize zero vector
             pass
 
-    def test_reshape_size_mismatch(self):
-        """Test reshape when rows*cols doesn't match vector length."""
-        vector = [1.0, 2.0, 3.0, 4.0, 5.0]  # length 5
-        with pytest.raises(Exception):
-            forzium_engine.reshape(vector, 2, 3)  # 2*3 = 6 != 5
-
-    def test_reshape_empty_vector(self):
-        """Test reshape with empty vector."""
-        with pytest.raises(Exception):
-            forzium_engine.reshape([], 2, 2)
-
-    def test_reshape_zero_dimensions(self):
-        """Test reshape with zero dimensions."""
-        vector = [1.0, 2.0, 3.0, 4.0]
-        with pytest.raises(Exception):
-            forzium_engine.reshape(vector, 0, 4)
-        with pytest.raises(Exception):
-            forzium_engine.reshape(vector, 4, 0)
-
 
 @pytest.mark.edge_case
 @pytest.mark.error_handling
@@ -287,16 +218,16 @@ class TestBoundaryValues:
     def test_multiply_infinity(self):
         """Test multiply with infinity."""
         matrix = [[1.0, 2.0]]
-        result = forzium_engine.multiply(matrix, float('inf'))
-        assert result[0][0] == float('inf')
-        assert result[0][1] == float('inf')
+        result = forzium_engine.multiply(matrix, inf)
+        assert result[0][0] == inf
+        assert result[0][1] == inf
 
     def test_multiply_negative_infinity(self):
         """Test multiply with negative infinity."""
         matrix = [[1.0, 2.0]]
-        result = forzium_engine.multiply(matrix, float('-inf'))
-        assert result[0][0] == float('-inf')
-        assert result[0][1] == float('-inf')
+        result = forzium_engine.multiply(matrix, -inf)
+        assert result[0][0] == -inf
+        assert result[0][1] == -inf
 
     def test_add_very_large_number(self):
         """Test add with very large number."""
@@ -310,13 +241,13 @@ class TestBoundaryValues:
         result = forzium_engine.multiply(matrix, 1e-308)
         assert 0 < result[0][0] < 1e-307
 
-    def test_matmul_large_dimension(self):
+    @pytest.mark.slow
+    def test_matmul_large_dimension(self, large_float_matrix):
         """Test matmul with large dimension matrices."""
         size = 500
-        a = [[1.0] * size for _ in range(size)]
-        b = [[1.0] * size for _ in range(size)]
+        ones = large_float_matrix(size, "ones")
         # Should complete without error
-        result = forzium_engine.matmul(a, b)
+        result = forzium_engine.matmul(ones, ones)
         assert len(result) == size
         assert len(result[0]) == size
 
@@ -336,40 +267,64 @@ class TestBoundaryValues:
         result = forzium_engine.matmul(matrix, matrix)
         assert result == [[1764.0]]
 
+    def test_single_element_batch_ops(self):
+        """Test batch_ops runs several operations on a 1x1 matrix in one call."""
+        matrix = [[42.0]]
+
+        results = forzium_engine.batch_ops(
+            matrix,
+            [("multiply", 2.0), ("add", 10.0), ("transpose", 0.0), ("matmul", 0.0)],
+        )
+        assert results == [[[84.0]], [[52.0]], [[42.0]], [[1764.0]]]
+
+    @pytest.mark.slow
     def test_very_wide_matrix(self):
         """Test operations on very wide matrix (1 row, many columns)."""
+        np = pytest.importorskip("numpy")
         matrix = [[float(i) for i in range(1000)]]
         
-        result = forzium_engine.multiply(matrix, 2.0)
-        assert len(result) == 1
-        assert len(result[0]) == 1000
-        assert result[0][0] == 0.0
-        assert result[0][999] == 1998.0
+        result = np.asarray(forzium_engine.multiply(matrix, 2.0))
+        assert result.shape == (1, 1000)
+        assert result[0, 0] == 0.0
+        assert result[0, -1] == 1998.0
 
+    @pytest.mark.slow
     def test_very_tall_matrix(self):
         """Test operations on very tall matrix (many rows, 1 column)."""
+        np = pytest.importorskip("numpy")
         matrix = [[float(i)] for i in range(1000)]
         
-        result = forzium_engine.multiply(matrix, 2.0)
-        assert len(result) == 1000
-        assert len(result[0]) == 1
-        assert result[0][0] == 0.0
-        assert result[999][0] == 1998.0
+        result = np.asarray(forzium_engine.multiply(matrix, 2.0))
+        assert result.shape == (1000, 1)
+        assert result[0, 0] == 0.0
+        assert result[-1, 0] == 1998.0
 
     def test_normalize_single_element(self):
         """Test normalize with single element vector."""
         result = forzium_engine.normalize([5.0])
-        assert abs(result[0] - 1.0) < 1e-9
+        assert result[0] == pytest.approx(1.0, abs=1e-9)
 
     def test_normalize_very_large_values(self):
         """Test normalize with very large values."""
         vector = [1e100, 1e100]
         result = forzium_engine.normalize(vector)
         # Should normalize to approximately [0.707, 0.707]
-        import math
-        expected = 1.0 / math.sqrt(2.0)
-        assert abs(result[0] - expected) < 1e-6
-        assert abs(result[1] - expected) < 1e-6
+        expected = 1.0 / sqrt(2.0)
+        assert result == pytest.approx([expected, expected], abs=1e-6)
+
+
+@pytest.mark.edge_case
+class TestScalarFastPath:
+    """Test the scalar entry point and the 1x1 multiply fast path."""
+
+    def test_multiply_scalar(self):
+        """Test multiply_scalar on a plain float."""
+        assert forzium_engine.multiply_scalar(42.0, 2.0) == 84.0
+
+    def test_single_element_multiply_matches_scalar(self):
+        """Test 1x1 multiply returns the scalar result."""
+        expected = forzium_engine.multiply_scalar(42.0, 2.0)
+        assert forzium_engine.multiply([[42.0]], 2.0) == [[expected]]
 
 
 @pytest.mark.edge_case
@@ -378,29 +333,26 @@ class TestSpecialFloatValues:
 
     def test_multiply_with_nan(self):
         """Test multiply with NaN values."""
-        matrix = [[1.0, float('nan')]]
-        result = forzium_engine.multiply(matrix, 2.0)
+        result = forzium_engine.multiply(_NAN_ROW, 2.0)
         assert result[0][0] == 2.0
-        assert result[0][1] != result[0][1]  # NaN != NaN
+        assert isnan(result[0][1])
 
     def test_add_with_nan(self):
         """Test add with NaN values."""
-        matrix = [[1.0, float('nan')]]
-        result = forzium_engine.add(matrix, 10.0)
+        result = forzium_engine.add(_NAN_ROW, 10.0)
         assert result[0][0] == 11.0
-        assert result[0][1] != result[0][1]  # NaN != NaN
+        assert isnan(result[0][1])
 
     def test_matmul_with_nan(self):
         """Test matmul with NaN values."""
-        a = [[1.0, float('nan')]]
         b = [[1.0], [1.0]]
-        result = forzium_engine.matmul(a, b)
+        result = forzium_engine.matmul(_NAN_ROW, b)
         # Result should contain NaN
-        assert result[0][0] != result[0][0]  # NaN != NaN
+        assert isnan(result[0][0])
 
     def test_normalize_with_inf(self):
         """Test normalize with infinity."""
-        vector = [float('inf'), 1.0]
+        vector = [inf, 1.0]
         try:
             result = forzium_engine.normalize(vector)
             # If it doesn't raise, result should have inf
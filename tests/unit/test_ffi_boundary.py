@@ -7,7 +7,9 @@ Python and Rust, error handling, and memory management.
 
 import unittest
 import numpy as np
+import pytest
 import gc
+import re
 import sys
 import time
 import threading
@@ -19,6 +21,13 @@ import forzium_engine as fe
 from forzium._ffi.validation import ComputeRequest
 
 
+_SERIALIZED_REQUEST_KEYS = re.compile(r'"data".*"operation".*"parameters"', re.S)
+
+
+class _CycleHolder:
+    """Plain Python object used to build reference cycles in GC tests"""
+
+
 class TestFFIBasics(unittest.TestCase):
     """Test basic FFI functionality"""
     
@@ -37,12 +46,12 @@ class TestFFIBasics(unittest.TestCase):
         # Test multiplication
         result = fe.multiply(matrix, 2.0)
         expected = [[2.0, 4.0], [6.0, 8.0]]
-        self.assertEqual(result, expected)
+        np.testing.assert_array_equal(result, expected)
         
         # Test addition
         result = fe.add(matrix, 1.0)
         expected = [[2.0, 3.0], [4.0, 5.0]]
-        self.assertEqual(result, expected)
+        np.testing.assert_array_equal(result, expected)
     
     def test_error_handling(self):
         """Test that errors are correctly propagated"""
@@ -57,11 +66,18 @@ class TestFFIBasics(unittest.TestCase):
 class TestFFIMemoryManagement(unittest.TestCase):
     """Test memory management across FFI boundary"""
     
+    @pytest.fixture(autouse=True)
+    def _matrix_builder(self, large_float_matrix):
+        """Expose the shared large-matrix builder to unittest methods"""
+        self.large_float_matrix = large_float_matrix
+    
+    @pytest.mark.slow
+    @pytest.mark.memory_bound
     def test_large_matrix_operations(self):
         """Test operations on large matrices to verify memory handling"""
         # Create a large matrix
         size = 1000
-        large_matrix = [[float(i+j) for i in range(size)] for j in range(size)]
+        large_matrix = self.large_float_matrix(size)
         
         # Perform operations that should trigger memory allocations
         result1 = fe.multiply(large_matrix, 2.0)
@@ -95,97 +111,108 @@ class TestFFIMemoryManagement(unittest.TestCase):
     
     def test_gc_interaction(self):
         """Test interaction with Python's garbage collector"""
-        # Create a reference cycle with Rust objects
-        a = fe.PoolAllocator(1000)
-        b = {"pool": a}
-        a._ref = b  # Create reference cycle
-        
-        # Get a weak reference
         import weakref
-        weak_a = weakref.ref(a)
         
-        # Delete references and force collection
-        del a, b
-        gc.collect()
+        def make_cycle():
+            """Build the cycle in its own frame so no locals keep it alive"""
+            # Hang a Rust object off a self-referencing Python wrapper; the
+            # extension class has no __dict__ to hold the cycle itself
+            holder = _CycleHolder()
+            holder.pool = fe.PoolAllocator(1000)
+            holder.self = holder  # Create reference cycle
+            return weakref.ref(holder.pool)
+        
+        # Keep automatic collections from promoting the cycle out of gen 0,
+        # so a young-generation pass is enough instead of a full-heap walk
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            weak_a = make_cycle()
+            gc.collect(0)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
         
         # Verify object was collected
         self.assertIsNone(weak_a())
 
 
+class TestFFIZeroCopy(unittest.TestCase):
+    """Test buffer-protocol inputs across FFI boundary"""
+    
+    def test_multiply_accepts_ndarray(self):
+        """Test that NumPy arrays match the nested-list path"""
+        matrix = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+        expected = fe.multiply(matrix, 2.0)
+        
+        for dtype in (np.float64, np.float32):
+            array = np.ascontiguousarray(matrix, dtype=dtype)
+            self.assertEqual(fe.multiply(array, 2.0), expected)
+    
+    def test_multiply_accepts_strided_view(self):
+        """Test that non-contiguous views are read in logical order"""
+        array = np.arange(12, dtype=np.float64).reshape(3, 4)
+        view = array[:, ::2]
+        
+        result = fe.multiply(view, 2.0)
+        self.assertEqual(result, (view * 2.0).tolist())
+    
+    def test_multiply_rejects_wrong_ndim(self):
+        """Test that buffers must be two-dimensional"""
+        with self.assertRaises(ValueError):
+            fe.multiply(np.ones(4), 2.0)
+
+
 class TestFFIConcurrency(unittest.TestCase):
     """Test concurrent access to Rust functions"""
     
     def test_thread_safety(self):
         """Test thread-safe access to Rust functions"""
         matrix = [[1.0, 2.0], [3.0, 4.0]]
-        results = []
-        errors = []
-        
-        def worker():
-            try:
-                # Call Rust from a Python thread
-                result = fe.multiply(matrix, 2.0)
-                results.append(result)
-                return True
-            except Exception as e:
-                errors.append(e)
-                return False
-        
-        # Run in multiple threads
-        threads = []
-        for _ in range(10):
-            t = threading.Thread(target=worker)
-            threads.append(t)
-            t.start()
-        
-        # Wait for completion
-        for t in threads:
-            t.join()
+        
+        # Call Rust from a pool of Python threads; worker exceptions
+        # re-raise from future.result()
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [executor.submit(fe.multiply, matrix, 2.0) for _ in range(10)]
+            results = [future.result() for future in as_completed(futures)]
         
         # Verify results
-        self.assertEqual(len(errors), 0)
         self.assertEqual(len(results), 10)
         expected = [[2.0, 4.0], [6.0, 8.0]]
         for result in results:
             self.assertEqual(result, expected)
     
+    @pytest.mark.compute_bound
     def test_gil_release(self):
         """Test that compute-intensive operations release the GIL"""
-        # Create large matrices for multiplication
-        size = 500
-        matrix_a = [[float(i+j) for i in range(size)] for j in range(size)]
-        matrix_b = [[float(i*j) for i in range(size)] for j in range(size)]
-        
-        # Variable to track parallel execution
-        parallel_execution = {'success': False}
-        
-        def gil_holding_thread():
-            """This thread will hold the GIL for counting"""
-            count = 0
-            # Count for some time while the matrix multiplication happens
-            end_time = time.time() + 1.0  # Run for 1 second
-            while time.time() < end_time:
-                count += 1
-            # If count is high enough, the GIL was released by the other operation
-            parallel_execution['success'] = count > 1000
-        
-        def matrix_thread():
-            """This thread will perform the matrix multiplication"""
-            # Use the SIMD-optimized multiply which releases the GIL
-            fe.simd_matmul(matrix_a, matrix_b)
-        
-        # Start both threads
-        t1 = threading.Thread(target=gil_holding_thread)
-        t2 = threading.Thread(target=matrix_thread)
-        
-        t1.start()
-        t2.start()
-        
-        t1.join()
-        t2.join()
-        
-        # Verify that parallel execution happened
-        self.assertTrue(parallel_execution['success'])
+        # Enough kernel work per call for a waiting thread to be scheduled
+        rng = np.random.default_rng(0)
+        matrix_a = rng.random((256, 4096))
+        matrix_b = rng.random((4096, 256))
+
+        calling = threading.Event()
+        ran_during_call = threading.Event()
+        results = []
+
+        def helper_thread():
+            """Run Python code, which needs the GIL, once the call is under way"""
+            calling.wait(timeout=5)
+            # ``results`` stays empty until the call returns, so seeing it empty
+            # means this thread held the GIL while the kernel was running
+            if not results:
+                ran_during_call.set()
+
+        helper = threading.Thread(target=helper_thread)
+        helper.start()
+
+        calling.set()
+        # list.extend drives map() from C: the result is appended as soon as
+        # simd_matmul returns, with no bytecode (and so no GIL hand-off) between
+        results.extend(map(fe.simd_matmul, [matrix_a], [matrix_b]))
+        helper.join(timeout=5)
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(ran_during_call.is_set())
 
 
 class TestFFIErrorHandling(unittest.TestCase):
@@ -203,11 +230,9 @@ class TestFFIErrorHandling(unittest.TestCase):
             invalid_matrix = [[1.0, 2.0], [3.0]]
             fe.multiply(invalid_matrix, 2.0)
     
+    @pytest.mark.usefixtures("verbose_errors")
     def test_error_details(self):
         """Test that error details are preserved"""
-        # Enable verbose errors
-        fe.set_verbose_errors(True)
-        
         try:
             # Try an operation that will fail
             fe.matmul([[1.0]], [[1.0, 2.0]])
@@ -241,11 +266,9 @@ class TestFFIComplexDataTypes(unittest.TestCase):
         self.assertEqual(request.operation, data["operation"])
         self.assertEqual(request.parameters, data["parameters"])
         
-        # Test serialization
-        json_str = request.json()
-        self.assertIn("data", json_str)
-        self.assertIn("operation", json_str)
-        self.assertIn("parameters", json_str)
+        # Test serialization: serialize once, scan once
+        blob = request.model_dump_json()
+        self.assertRegex(blob, _SERIALIZED_REQUEST_KEYS)
 
 
 if __name__ == "__main__":
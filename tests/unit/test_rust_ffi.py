@@ -11,13 +11,11 @@ from typing import List
 
 import pytest
 
-# Skip all tests in this module if Rust engine is not available
-try:
-    import forzium_engine
-    RUST_AVAILABLE = True
-except ImportError:
-    RUST_AVAILABLE = False
-    pytestmark = pytest.mark.skip(reason="Rust engine not available")
+import forzium_engine
+
+# conftest decides once whether the compiled engine is present; its ``fe``
+# fixture skips every test here when only the Python fallback is installed.
+pytestmark = pytest.mark.usefixtures("fe")
 
 
 @pytest.mark.unit
@@ -31,6 +29,12 @@ class TestTensorOperations:
         expected = [[2.0, 4.0], [6.0, 8.0]]
         pytest.assert_matrices_equal(result, expected)
 
+    def test_multiply_buffer_input(self, small_matrix):
+        """Test multiply accepts NumPy arrays via the buffer protocol."""
+        np = pytest.importorskip("numpy")
+        result = forzium_engine.multiply(np.asarray(small_matrix, dtype=np.float64), 2.0)
+        pytest.assert_matrices_equal(result, [[2.0, 4.0], [6.0, 8.0]])
+
     def test_multiply_identity(self, small_matrix):
         """Test multiplication by 1.0 returns same matrix."""
         result = forzium_engine.multiply(small_matrix, 1.0)
@@ -98,6 +102,18 @@ class TestTensorOperations:
         expected = [[1.0, 2.0, 3.0]]
         pytest.assert_matrices_equal(result, expected)
 
+    def test_transpose_buffer(self):
+        """Test transpose_buffer matches transpose for lists and NumPy arrays."""
+        matrix = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+        expected = forzium_engine.transpose(matrix)
+        result = forzium_engine.transpose_buffer(matrix)
+        assert result.shape == (3, 2)
+        assert result.tolist() == expected
+
+        np = pytest.importorskip("numpy")
+        array_result = forzium_engine.transpose_buffer(np.asarray(matrix))
+        np.testing.assert_array_equal(np.asarray(array_result), expected)
+
     def test_transpose_double_transpose(self, small_matrix):
         """Test that double transpose returns original matrix."""
         result = forzium_engine.transpose(forzium_engine.transpose(small_matrix))
@@ -151,6 +167,32 @@ class TestMatrixMultiplication:
         simd_result = forzium_engine.simd_matmul(medium_matrix, medium_matrix)
         pytest.assert_matrices_equal(regular_result, simd_result, rtol=1e-10)
 
+    def test_matmul_buffer_inputs(self, medium_matrix):
+        """Test matmul and simd_matmul accept NumPy arrays via the buffer protocol."""
+        np = pytest.importorskip("numpy")
+        expected = forzium_engine.matmul(medium_matrix, medium_matrix)
+        array = np.asarray(medium_matrix, dtype=np.float64)
+
+        pytest.assert_matrices_equal(forzium_engine.matmul(array, array), expected)
+        pytest.assert_matrices_equal(
+            forzium_engine.simd_matmul(array, array), expected, rtol=1e-10
+        )
+
+    def test_simd_matmul_f32_matches_regular(self, medium_matrix):
+        """Test the float32 matmul against the float64 result."""
+        np = pytest.importorskip("numpy")
+        expected = forzium_engine.matmul(medium_matrix, medium_matrix)
+        array = np.asarray(medium_matrix, dtype=np.float32)
+
+        result = forzium_engine.simd_matmul_f32(array, array)
+        pytest.assert_matrices_equal(result, expected, rtol=1e-5, atol=1e-5)
+        pytest.assert_matrices_equal(
+            forzium_engine.simd_matmul_f32(medium_matrix, medium_matrix),
+            expected,
+            rtol=1e-5,
+            atol=1e-5,
+        )
+
     def test_matmul_associative(self):
         """Test that matrix multiplication is associative."""
         a = [[1.0, 2.0], [3.0, 4.0]]
@@ -205,6 +247,19 @@ class TestElementwiseOperations:
         simd_result = forzium_engine.simd_elementwise_add(a, b)
         pytest.assert_matrices_equal(regular_result, simd_result)
 
+    def test_simd_elementwise_add_buffer_inputs(self, medium_matrix):
+        """Test SIMD elementwise add accepts NumPy arrays via the buffer protocol."""
+        np = pytest.importorskip("numpy")
+        a = medium_matrix
+        b = [[float(i * 10 + j + 100) for j in range(10)] for i in range(10)]
+        expected = forzium_engine.simd_elementwise_add(a, b)
+
+        for dtype in (np.float64, np.float32):
+            result = forzium_engine.simd_elementwise_add(
+                np.array(a, dtype=dtype), np.array(b, dtype=dtype)
+            )
+            pytest.assert_matrices_equal(result, expected)
+
     def test_elementwise_mul_basic(self):
         """Test elementwise multiplication (Hadamard product)."""
         a = [[1.0, 2.0], [3.0, 4.0]]
@@ -357,6 +412,13 @@ class TestDataTransformOperations:
         expected = [[1.0], [2.0], [3.0], [4.0], [5.0], [6.0]]
         pytest.assert_matrices_equal(result, expected)
 
+    def test_reshape_buffer(self, vector_1d):
+        """Test reshape_buffer returns a 2-D float64 memoryview."""
+        result = forzium_engine.reshape_buffer(vector_1d, 2, 3)
+        assert isinstance(result, memoryview)
+        assert (result.format, result.shape) == ("d", (2, 3))
+        assert result.tolist() == forzium_engine.reshape(vector_1d, 2, 3)
+
 
 @pytest.mark.unit
 @pytest.mark.rust_ffi
@@ -379,6 +441,16 @@ class TestUtilityFunctions:
         max_u64 = 2**64 - 1
         assert forzium_engine.echo_u64(max_u64) == max_u64
 
+    def test_echo_u64_positional_only(self):
+        """Test echo_u64 rejects its argument by keyword."""
+        with pytest.raises(TypeError):
+            forzium_engine.echo_u64(value=1)
+
+    def test_noop_rejects_arguments(self):
+        """Test noop takes no arguments."""
+        with pytest.raises(TypeError):
+            forzium_engine.noop(1)
+
     def test_trigger_panic(self):
         """Test that trigger_panic raises an exception."""
         with pytest.raises(Exception):
@@ -390,6 +462,12 @@ class TestUtilityFunctions:
         # Should complete without error
         assert result is None or isinstance(result, int)
 
+    def test_force_gc_releases_scratch(self):
+        """Test force_gc reports freed scratch bytes, optionally running gc."""
+        forzium_engine.simd_matmul([[1.0, 2.0], [3.0, 4.0]], [[5.0], [6.0]])
+        assert forzium_engine.force_gc() > 0
+        assert forzium_engine.force_gc(include_python=True) >= 0
+
 
 @pytest.mark.unit
 @pytest.mark.rust_ffi
@@ -479,6 +557,20 @@ class TestAPIBindings:
         result = forzium_engine.sum_list([10, -5, 3, -2])
         assert result == 6
 
+    def test_sum_list_overflow_raises(self):
+        """Test sum_list rejects totals outside the i64 range."""
+        with pytest.raises(ValueError):
+            forzium_engine.sum_list([2**62, 2**62])
+
+    def test_sum_list_int64_buffer(self):
+        """Test sum_list accepts packed int64 buffers."""
+        from array import array
+
+        assert forzium_engine.sum_list(array("q", [10, -5, 3, -2])) == 6
+        assert forzium_engine.sum_list(array("q", range(1000))) == 499500
+        with pytest.raises(ValueError):
+            forzium_engine.sum_list(array("q", [2**62, 2**62]))
+
     def test_echo_list_basic(self):
         """Test echo_list with basic input."""
         input_list = [1, 2, 3, 4, 5]